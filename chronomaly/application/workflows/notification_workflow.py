@@ -2,6 +2,8 @@
 Notification workflow orchestrator.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 from typing import List
 from ...infrastructure.notifiers.base import Notifier
@@ -19,9 +21,19 @@ class NotificationWorkflow:
     Args:
         anomalies_data: DataFrame containing anomaly detection results
         notifiers: List of notifier instances (email, Slack, etc.)
+        max_workers: Maximum number of notifiers to run at the same time.
+                     Notifiers talk to different services (SMTP server, Slack
+                     API), so running them concurrently makes run() take as
+                     long as the slowest one instead of the sum (default: 1,
+                     one after another)
     """
 
-    def __init__(self, anomalies_data: pd.DataFrame, notifiers: List[Notifier]):
+    def __init__(
+        self,
+        anomalies_data: pd.DataFrame,
+        notifiers: List[Notifier],
+        max_workers: int = 1,
+    ):
         # Validate anomalies_data
         if not isinstance(anomalies_data, pd.DataFrame):
             raise TypeError(
@@ -51,6 +63,13 @@ class NotificationWorkflow:
 
         self.notifiers = notifiers
 
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}"
+            )
+
+        self.max_workers: int = max_workers
+
     def run(self) -> None:
         """
         Execute the complete notification workflow.
@@ -70,12 +89,39 @@ class NotificationWorkflow:
         payload = {"anomalies": self.anomalies_data}
 
         # Send notifications via all notifiers
-        for notifier in self.notifiers:
-            try:
-                notifier.notify(payload)
-            except Exception as e:
-                # Re-raise with context about which notifier failed
-                notifier_name = type(notifier).__name__
-                raise RuntimeError(
-                    f"Failed to send notification via {notifier_name}: {str(e)}"
-                ) from e
+        workers = min(self.max_workers, len(self.notifiers))
+        if workers == 1:
+            for notifier in self.notifiers:
+                self._notify(notifier, payload)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._notify, notifier, payload)
+                for notifier in self.notifiers
+            ]
+        # Every notifier has finished here; report the first failure in
+        # notifier order
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _notify(notifier: Notifier, payload: dict) -> None:
+        """
+        Send the payload via one notifier.
+
+        Args:
+            notifier: Notifier to send with
+            payload: Notification payload
+
+        Raises:
+            RuntimeError: If the notifier fails
+        """
+        try:
+            notifier.notify(payload)
+        except Exception as e:
+            # Re-raise with context about which notifier failed
+            notifier_name = type(notifier).__name__
+            raise RuntimeError(
+                f"Failed to send notification via {notifier_name}: {str(e)}"
+            ) from e
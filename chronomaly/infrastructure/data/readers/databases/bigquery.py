@@ -4,7 +4,6 @@ BigQuery data reader implementation.
 
 import pandas as pd
 import os
-import re
 from typing import Optional, Dict, List, Callable
 from google.cloud import bigquery
 from google.oauth2 import service_account
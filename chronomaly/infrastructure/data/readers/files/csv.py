@@ -4,7 +4,10 @@ CSV data reader implementation.
 
 import pandas as pd
 import os
-from typing import Optional, Dict, Any, List, Callable
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from typing import Optional, Dict, Any, List, Callable, Iterator
 from ..base import DataReader
 from chronomaly.shared import TransformableMixin
 
@@ -70,22 +73,107 @@ class CSVDataReader(DataReader, TransformableMixin):
         if df.empty:
             raise ValueError(f"CSV file is empty: {self.file_path}")
 
-        if self.date_column:
-            if self.date_column not in df.columns:
-                raise ValueError(
-                    f"date_column '{self.date_column}' not found in CSV file. "
-                    f"Available columns: {list(df.columns)}"
-                )
-
-            try:
-                df[self.date_column] = pd.to_datetime(df[self.date_column])
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to parse date_column '{self.date_column}' "
-                    f"as datetime: {str(e)}"
-                ) from e
+        df = self._parse_date_column(df)
 
         # Apply transformers after loading data
         df = self._apply_transformers(df, "after")
 
         return df
+
+    def load_arrow_stream(self, block_size: int = 16 << 20) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the CSV file as Arrow record batches without loading it fully.
+
+        Blocks are parsed by PyArrow as they are pulled, so only one block is
+        held in memory at a time. Keyword arguments given for pandas.read_csv()
+        are not applied on this path.
+
+        Args:
+            block_size: Number of bytes parsed per block (default: 16 MiB)
+
+        Yields:
+            pa.RecordBatch: The next parsed block of rows
+
+        Raises:
+            RuntimeError: If the CSV file cannot be opened or parsed
+        """
+        try:
+            reader = pa_csv.open_csv(
+                self.file_path,
+                read_options=pa_csv.ReadOptions(block_size=block_size),
+            )
+            # Later blocks are parsed while iterating and can fail too, e.g.
+            # when their values don't match the types inferred from the first
+            yield from reader
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read CSV file '{self.file_path}': {str(e)}"
+            ) from e
+
+    def load_batches(self, block_size: int = 16 << 20) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV file as a sequence of pandas DataFrames.
+
+        Each Arrow record batch from load_arrow_stream() is converted to pandas,
+        the date column is parsed and the 'after' transformers are applied per
+        batch. Use this instead of load() when the file does not fit in memory.
+
+        Args:
+            block_size: Number of bytes parsed per block (default: 16 MiB)
+
+        Yields:
+            pd.DataFrame: The next batch of rows
+
+        Raises:
+            RuntimeError: If the CSV file cannot be opened or parsed
+            ValueError: If date_column is not found or cannot be parsed
+        """
+        for batch in self.load_arrow_stream(block_size=block_size):
+            df = batch.to_pandas()
+            df = self._parse_date_column(df)
+            yield self._apply_transformers(df, "after")
+
+    def _parse_date_column(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse the configured date column as datetime.
+
+        Args:
+            df: DataFrame read from the CSV file
+
+        Returns:
+            pd.DataFrame: DataFrame with the date column parsed
+
+        Raises:
+            ValueError: If date_column is not found or cannot be parsed
+        """
+        if not self.date_column:
+            return df
+
+        if self.date_column not in df.columns:
+            raise ValueError(
+                f"date_column '{self.date_column}' not found in CSV file. "
+                f"Available columns: {list(df.columns)}"
+            )
+
+        column = df[self.date_column]
+
+        # ISO-8601 strings are parsed by Arrow's cast kernel, which runs
+        # outside the GIL over the whole string buffer. Anything it rejects
+        # (other formats, zone offsets) falls back to pandas.
+        if pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            try:
+                parsed = pc.cast(pa.Array.from_pandas(column), pa.timestamp("ns"))
+                df[self.date_column] = parsed.to_numpy(zero_copy_only=False)
+                return df
+            except (pa.ArrowException, TypeError):
+                pass
+
+        try:
+            df[self.date_column] = pd.to_datetime(column)
+        except Exception as e:
+            raise ValueError(
+                f"Failed to parse date_column '{self.date_column}' "
+                f"as datetime: {str(e)}"
+            ) from e
+
+        return df
@@ -2,7 +2,7 @@
 Database data writers.
 """
 
-from .bigquery import BigQueryDataWriter
+from .bigquery import BigQueryDataWriter, close_clients, wait_all
 from .sqlite import SQLiteDataWriter
 
-__all__ = ["BigQueryDataWriter", "SQLiteDataWriter"]
+__all__ = ["BigQueryDataWriter", "SQLiteDataWriter", "close_clients", "wait_all"]
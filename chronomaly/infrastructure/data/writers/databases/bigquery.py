@@ -2,15 +2,123 @@
 BigQuery data writer implementation.
 """
 
+import functools
+import io
 import os
+import stat
+import threading
+import time
 
 import pandas as pd
-from typing import Optional, Dict, List, Callable
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Optional, Dict, Iterable, List, Callable, Tuple
 from google.cloud import bigquery
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types as storage_types
 from google.oauth2 import service_account
 from ..base import DataWriter
 from chronomaly.shared import TransformableMixin
 
+# BigQuery clients shared by all writers, keyed by (service_account_file, project),
+# with the key file's mtime the client's credentials were loaded from
+_clients: Dict[Tuple[str, str], Tuple[float, bigquery.Client]] = {}
+_clients_lock = threading.Lock()
+
+# Disposition names accepted by BigQueryDataWriter and their job config values
+_CREATE_MAP = {
+    "CREATE_IF_NEEDED": bigquery.CreateDisposition.CREATE_IF_NEEDED,
+    "CREATE_NEVER": bigquery.CreateDisposition.CREATE_NEVER,
+}
+_WRITE_MAP = {
+    "WRITE_TRUNCATE": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "WRITE_APPEND": bigquery.WriteDisposition.WRITE_APPEND,
+    "WRITE_EMPTY": bigquery.WriteDisposition.WRITE_EMPTY,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials(
+    service_account_file: str, mtime: float
+) -> service_account.Credentials:
+    """
+    Parse service account credentials, cached per file path and mtime.
+
+    Including the modification time in the cache key means a rotated key file
+    is parsed again instead of being served from the cache.
+
+    Args:
+        service_account_file: Absolute path to the service account JSON file
+        mtime: Modification time of the file (os.stat().st_mtime)
+
+    Returns:
+        service_account.Credentials: Parsed credentials
+    """
+    return service_account.Credentials.from_service_account_file(service_account_file)
+
+
+def _get_credentials(service_account_file: str) -> service_account.Credentials:
+    """
+    Return cached credentials for a service account file.
+
+    Args:
+        service_account_file: Absolute path to the service account JSON file
+
+    Returns:
+        service_account.Credentials: Parsed credentials
+    """
+    mtime = os.stat(service_account_file).st_mtime
+    return _load_credentials(service_account_file, mtime)
+
+
+def _build_client(service_account_file: str, project: str) -> bigquery.Client:
+    """
+    Return the shared BigQuery client for a service account and project.
+
+    The client is created on first use and reused by every writer with the
+    same service account file and project, so credentials parsing and HTTP
+    session setup happen once per process. If the key file's mtime changes
+    (e.g. the key was rotated), a new client with the new credentials
+    replaces it. The old client is not closed, as writers may still be using
+    it.
+
+    Args:
+        service_account_file: Absolute path to the service account JSON file
+        project: GCP project ID
+
+    Returns:
+        bigquery.Client: Shared BigQuery client
+    """
+    key = (service_account_file, project)
+    mtime = os.stat(service_account_file).st_mtime
+    with _clients_lock:
+        cached = _clients.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        credentials = _load_credentials(service_account_file, mtime)
+        client = bigquery.Client(credentials=credentials, project=project)
+        _clients[key] = (mtime, client)
+
+    return client
+
+
+def close_clients() -> None:
+    """
+    Close and forget all shared BigQuery clients created by writers.
+
+    Call this on shutdown of long-running applications to release HTTP
+    connections. Cached credentials are dropped as well. Writers create a new
+    client on their next write.
+    """
+    with _clients_lock:
+        clients = [client for _, client in _clients.values()]
+        _clients.clear()
+        _load_credentials.cache_clear()
+
+    for client in clients:
+        client.close()
+
 
 class BigQueryDataWriter(DataWriter, TransformableMixin):
     """
@@ -26,11 +134,34 @@ class BigQueryDataWriter(DataWriter, TransformableMixin):
         write_disposition: Specifies behavior if table exists
                           (default: WRITE_TRUNCATE - replaces existing data)
         transformers: Optional dict of transformer lists to apply before/after writing
+        chunk_rows: Maximum number of rows uploaded per load job. Splitting a
+                    frame across several load jobs makes the write
+                    non-atomic: if a later chunk fails, the table keeps the
+                    earlier chunks, and after WRITE_TRUNCATE only those
+                    (default: None, one all-or-nothing load job)
+        use_storage_write_api: If True, stream rows through the BigQuery Storage
+                               Write API default stream instead of running
+                               load jobs (default: False)
     """
 
+    # Target size of a single Storage Write API append request (limit: 10 MB)
+    STORAGE_WRITE_REQUEST_BYTES = 5 * 1024 * 1024
+
+    # Load job polling: HTTP timeout per status check and exponential backoff
+    # between checks (seconds)
+    JOB_POLL_TIMEOUT = 5.0
+    JOB_POLL_INITIAL_DELAY = 1.0
+    JOB_POLL_MULTIPLIER = 1.5
+    JOB_POLL_MAX_DELAY = 60.0
+
+    # Parquet encoding used for load job uploads
+    PARQUET_COMPRESSION = "zstd"
+    PARQUET_COMPRESSION_LEVEL = 3
+    PARQUET_DATA_PAGE_SIZE = 1 << 20
+
     # Valid disposition values
-    VALID_CREATE_DISPOSITIONS = {"CREATE_IF_NEEDED", "CREATE_NEVER"}
-    VALID_WRITE_DISPOSITIONS = {"WRITE_TRUNCATE", "WRITE_APPEND", "WRITE_EMPTY"}
+    VALID_CREATE_DISPOSITIONS = frozenset(_CREATE_MAP)
+    VALID_WRITE_DISPOSITIONS = frozenset(_WRITE_MAP)
 
     def __init__(
         self,
@@ -41,13 +172,21 @@ class BigQueryDataWriter(DataWriter, TransformableMixin):
         create_disposition: str = "CREATE_IF_NEEDED",
         write_disposition: str = "WRITE_TRUNCATE",
         transformers: Optional[Dict[str, List[Callable]]] = None,
+        chunk_rows: Optional[int] = None,
+        use_storage_write_api: bool = False,
     ):
         # Validate service_account_file (same as BigQueryDataReader)
         if not service_account_file or not service_account_file.strip():
             raise ValueError("'service_account_file' cannot be empty")
 
         abs_path = os.path.abspath(service_account_file)
-        if not os.path.isfile(abs_path):
+        # One stat call covers both existence and file type; like
+        # os.path.isfile(), any stat error counts as not found
+        try:
+            file_stat = os.stat(abs_path)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"'service_account_file' not found: {abs_path}")
 
         if not os.access(abs_path, os.R_OK):
@@ -86,38 +225,78 @@ class BigQueryDataWriter(DataWriter, TransformableMixin):
                 f"Must be one of: {', '.join(sorted(self.VALID_WRITE_DISPOSITIONS))}"
             )
 
+        if chunk_rows is not None and (
+            not isinstance(chunk_rows, int) or chunk_rows <= 0
+        ):
+            raise ValueError(
+                f"chunk_rows must be a positive integer, got: {chunk_rows}"
+            )
+
         self.create_disposition = create_disposition
         self.write_disposition = write_disposition
-        self._client = None
+        self.chunk_rows = chunk_rows
+        self.use_storage_write_api = use_storage_write_api
+        self._write_client = None
         self.transformers = transformers or {}
 
     def _get_client(self) -> bigquery.Client:
         """
-        Create and return BigQuery client.
+        Return the BigQuery client shared by writers with the same credentials.
 
         Returns:
             bigquery.Client: Initialized BigQuery client
         """
-        if self._client is None:
+        try:
+            return _build_client(self.service_account_file, self.project)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create BigQuery client: {str(e)}") from e
+
+    def _get_write_client(self) -> bigquery_storage_v1.BigQueryWriteClient:
+        """
+        Create and return BigQuery Storage Write API client.
+
+        Returns:
+            bigquery_storage_v1.BigQueryWriteClient: Initialized write client
+        """
+        if self._write_client is None:
             try:
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.service_account_file
-                )
+                credentials = _get_credentials(self.service_account_file)
 
-                self._client = bigquery.Client(
-                    credentials=credentials, project=self.project
+                self._write_client = bigquery_storage_v1.BigQueryWriteClient(
+                    credentials=credentials
                 )
             except Exception as e:
-                raise RuntimeError(f"Failed to create BigQuery client: {str(e)}") from e
+                raise RuntimeError(
+                    f"Failed to create BigQuery Storage Write client: {str(e)}"
+                ) from e
 
-        return self._client
+        return self._write_client
 
-    def write(self, dataframe: pd.DataFrame) -> None:
+    def write(
+        self, dataframe: pd.DataFrame, await_completion: bool = True
+    ) -> Optional[List[bigquery.LoadJob]]:
         """
         Write forecast results to BigQuery table.
 
+        Data is uploaded as Parquet in a single load job, unless chunk_rows
+        is set. Then it is uploaded in chunks of at most chunk_rows rows: the
+        first chunk honors the configured dispositions, later chunks are
+        appended to the table it created and are loaded concurrently. A
+        failed chunk leaves the earlier ones in the table.
+
         Args:
             dataframe: The forecast results as a pandas DataFrame
+            await_completion: If False, return the submitted load jobs instead
+                              of waiting for them, so writes to several tables
+                              can be pipelined and awaited with wait_all().
+                              When the data spans several chunks, the first
+                              chunk is still awaited before the others are
+                              submitted. Ignored by the Storage Write API path,
+                              which always completes before returning.
+
+        Returns:
+            Optional[List[bigquery.LoadJob]]: Pending load jobs if
+            await_completion is False and load jobs were used, otherwise None
 
         Raises:
             RuntimeError: If the BigQuery write job fails
@@ -127,50 +306,331 @@ class BigQueryDataWriter(DataWriter, TransformableMixin):
 
         # Convert all columns to string for consistent BigQuery schema
         # This prevents type mismatches between empty and non-empty DataFrames
-        dataframe = dataframe.astype(str)
+        table = self._to_string_table(dataframe)
 
         client = self._get_client()
 
         # Construct table ID (modern API - replaces deprecated dataset().table())
         table_id = f"{self.project}.{self.dataset}.{self.table}"
 
-        # Configure load job
-        bigquery_job_config = bigquery.LoadJobConfig()
+        if self.use_storage_write_api:
+            self._write_with_storage_api(client, table, table_id)
+            return None
 
-        # Set create disposition
-        if self.create_disposition == "CREATE_IF_NEEDED":
-            bigquery_job_config.create_disposition = (
-                bigquery.CreateDisposition.CREATE_IF_NEEDED
-            )
-        elif self.create_disposition == "CREATE_NEVER":
-            bigquery_job_config.create_disposition = (
-                bigquery.CreateDisposition.CREATE_NEVER
+        # An empty DataFrame still runs one load job so the table is
+        # created or truncated as configured
+        chunk_rows = self.chunk_rows or max(table.num_rows, 1)
+        chunk_starts = range(0, max(table.num_rows, 1), chunk_rows)
+
+        jobs = []
+        for chunk_index, chunk_start in enumerate(chunk_starts):
+            if chunk_index == 0:
+                job_config = self._build_job_config(
+                    self.create_disposition, self.write_disposition
+                )
+            else:
+                job_config = self._build_job_config("CREATE_NEVER", "WRITE_APPEND")
+
+            # Load Parquet data to BigQuery using table_id string
+            job = client.load_table_from_file(
+                self._to_parquet_buffer(table.slice(chunk_start, chunk_rows)),
+                table_id,
+                job_config=job_config,
             )
 
-        # Set write disposition
-        if self.write_disposition == "WRITE_TRUNCATE":
-            bigquery_job_config.write_disposition = (
-                bigquery.WriteDisposition.WRITE_TRUNCATE
+            # Later chunks append to the table the first chunk creates or
+            # truncates, so that job has to finish before they are submitted
+            if chunk_index == 0 and len(chunk_starts) > 1:
+                self._wait_for_job(job)
+            else:
+                jobs.append(job)
+
+        if not await_completion:
+            return jobs
+
+        for job in jobs:
+            self._wait_for_job(job)
+
+        return None
+
+    def _write_with_storage_api(
+        self, client: bigquery.Client, table: pa.Table, table_id: str
+    ) -> None:
+        """
+        Stream an Arrow table into the table's Storage Write API default stream.
+
+        Dispositions are applied up front: the table is created with an
+        all-STRING schema if needed, WRITE_TRUNCATE empties it and
+        WRITE_EMPTY refuses to write into a non-empty table.
+
+        Args:
+            client: BigQuery client used for table management
+            table: Table with string columns to write
+            table_id: Fully qualified destination table ID
+
+        Raises:
+            RuntimeError: If preparing the table or appending rows fails
+        """
+        try:
+            if self.create_disposition == "CREATE_IF_NEEDED":
+                schema = [
+                    bigquery.SchemaField(name, "STRING") for name in table.column_names
+                ]
+                client.create_table(
+                    bigquery.Table(table_id, schema=schema), exists_ok=True
+                )
+
+            if self.write_disposition == "WRITE_TRUNCATE":
+                client.query(f"TRUNCATE TABLE `{table_id}`").result()
+            elif self.write_disposition == "WRITE_EMPTY":
+                if client.get_table(table_id).num_rows:
+                    raise RuntimeError(
+                        "Destination table is not empty and write_disposition "
+                        "is WRITE_EMPTY"
+                    )
+
+            if table.num_rows == 0:
+                return
+
+            write_client = self._get_write_client()
+            stream_name = (
+                write_client.table_path(self.project, self.dataset, self.table)
+                + "/streams/_default"
             )
-        elif self.write_disposition == "WRITE_APPEND":
-            bigquery_job_config.write_disposition = (
-                bigquery.WriteDisposition.WRITE_APPEND
+            responses = write_client.append_rows(
+                iter(self._build_append_requests(table, stream_name)),
+                # Streaming calls carry no request fields for routing
+                metadata=(("x-goog-request-params", f"write_stream={stream_name}"),),
             )
-        elif self.write_disposition == "WRITE_EMPTY":
-            bigquery_job_config.write_disposition = (
-                bigquery.WriteDisposition.WRITE_EMPTY
+
+            for response in responses:
+                if response.error.code or response.row_errors:
+                    message = response.error.message or str(list(response.row_errors))
+                    raise RuntimeError(message)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to write to BigQuery table {self.dataset}.{self.table}. "
+                f"Error: {str(e)}"
+            ) from e
+
+    def _build_append_requests(
+        self, table: pa.Table, stream_name: str
+    ) -> List[storage_types.AppendRowsRequest]:
+        """
+        Split an Arrow table into Storage Write API append requests.
+
+        Args:
+            table: Table with string columns to write
+            stream_name: Full resource name of the destination write stream
+
+        Returns:
+            list: Append requests carrying serialized Arrow record batches
+        """
+        rows_per_request = max(
+            1,
+            table.num_rows * self.STORAGE_WRITE_REQUEST_BYTES // max(table.nbytes, 1),
+        )
+        writer_schema = storage_types.ArrowSchema(
+            serialized_schema=table.schema.serialize().to_pybytes()
+        )
+
+        return [
+            storage_types.AppendRowsRequest(
+                write_stream=stream_name,
+                arrow_rows=storage_types.AppendRowsRequest.ArrowData(
+                    writer_schema=writer_schema,
+                    rows=storage_types.ArrowRecordBatch(
+                        serialized_record_batch=batch.serialize().to_pybytes(),
+                        row_count=batch.num_rows,
+                    ),
+                ),
             )
+            for batch in table.to_batches(max_chunksize=rows_per_request)
+        ]
+
+    def _build_job_config(
+        self, create_disposition: str, write_disposition: str
+    ) -> bigquery.LoadJobConfig:
+        """
+        Build the load job configuration for a Parquet upload.
+
+        Args:
+            create_disposition: Create disposition name
+            write_disposition: Write disposition name
 
-        # Load dataframe to BigQuery using table_id string
-        job = client.load_table_from_dataframe(
-            dataframe, table_id, job_config=bigquery_job_config
+        Returns:
+            bigquery.LoadJobConfig: Configured load job settings
+        """
+        return bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            create_disposition=_CREATE_MAP[create_disposition],
+            write_disposition=_WRITE_MAP[write_disposition],
         )
 
-        # Wait for the job to complete with proper error handling
+    def _wait_for_job(self, job: bigquery.LoadJob) -> None:
+        """
+        Wait for a load job to complete.
+
+        Args:
+            job: The submitted load job
+
+        Raises:
+            RuntimeError: If the load job fails
+        """
         try:
-            job.result()
+            self._poll_job(job)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to write to BigQuery table {self.dataset}.{self.table}. "
                 f"Error: {str(e)}"
             ) from e
+
+    @classmethod
+    def _poll_job(cls, job: bigquery.LoadJob, deadline: Optional[float] = None) -> None:
+        """
+        Poll a load job until it is done and raise if it failed.
+
+        Each status call uses a short timeout so a slow request cannot stall
+        the wait, and the delay between polls backs off exponentially.
+
+        Args:
+            job: The submitted load job
+            deadline: Optional time.monotonic() value after which to give up
+
+        Raises:
+            TimeoutError: If the deadline passes before the job is done
+            Exception: Any error reported by the job
+        """
+        delay = cls.JOB_POLL_INITIAL_DELAY
+        while not job.done(timeout=cls.JOB_POLL_TIMEOUT):
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out waiting for BigQuery load job {job.job_id}"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * cls.JOB_POLL_MULTIPLIER, cls.JOB_POLL_MAX_DELAY)
+
+        # Raises if the job finished with errors
+        job.result(timeout=cls.JOB_POLL_TIMEOUT)
+
+    def _to_string_table(self, dataframe: pd.DataFrame) -> pa.Table:
+        """
+        Convert a DataFrame to an Arrow table with all columns as strings.
+
+        Integer and string columns are converted with Arrow's vectorized
+        cast kernels, which produce the same text as astype(str). Floats,
+        booleans, datetimes and mixed object columns go through a single
+        astype(str) call, because Arrow renders them differently ('1' for
+        1.0, 'true' for True, '2024-01-01 00:00:00.000000000' for a date)
+        and tables that are appended to should keep one format. Missing
+        values become NULL.
+
+        Args:
+            dataframe: DataFrame to convert
+
+        Returns:
+            pa.Table: Table with string columns
+        """
+        arrays = [self._cast_to_string(column) for _, column in dataframe.items()]
+
+        positions = [i for i, array in enumerate(arrays) if array is None]
+        if positions:
+            # Converted together, as pandas formats datetimes per block
+            subset = dataframe.iloc[:, positions]
+            text = subset.astype(str)
+            missing = subset.isna()
+            for i, position in enumerate(positions):
+                values = text.iloc[:, i].to_numpy(dtype=object)
+                values[missing.iloc[:, i].to_numpy()] = None
+                arrays[position] = pa.array(values, type=pa.string())
+
+        return pa.Table.from_arrays(
+            arrays, names=[str(name) for name in dataframe.columns]
+        )
+
+    @staticmethod
+    def _cast_to_string(column: pd.Series) -> Optional[pa.Array]:
+        """
+        Cast an integer or string column to an Arrow string array.
+
+        Args:
+            column: Column to convert
+
+        Returns:
+            Optional[pa.Array]: String array with NULL for missing values, or
+            None if the column needs astype(str) to keep its text
+        """
+        if not (pd.api.types.is_integer_dtype(column) or column.dtype == object):
+            return None
+
+        try:
+            array = pa.array(column, from_pandas=True)
+        except (pa.ArrowException, TypeError):
+            return None
+
+        if (
+            pa.types.is_integer(array.type)
+            or pa.types.is_string(array.type)
+            or pa.types.is_large_string(array.type)
+            or pa.types.is_null(array.type)
+        ):
+            return array.cast(pa.string())
+
+        return None
+
+    def _to_parquet_buffer(self, table: pa.Table) -> io.BytesIO:
+        """
+        Serialize an Arrow table to an in-memory Parquet file.
+
+        The all-string columns are dictionary encoded and ZSTD compressed,
+        which keeps repetitive values (dates, metric names) small on the wire.
+
+        Args:
+            table: Table to serialize
+
+        Returns:
+            io.BytesIO: Parquet data, positioned at the start of the buffer
+        """
+        buffer = io.BytesIO()
+        pq.write_table(
+            table,
+            buffer,
+            compression=self.PARQUET_COMPRESSION,
+            compression_level=self.PARQUET_COMPRESSION_LEVEL,
+            use_dictionary=True,
+            data_page_size=self.PARQUET_DATA_PAGE_SIZE,
+        )
+        buffer.seek(0)
+
+        return buffer
+
+
+def wait_all(jobs: Iterable[bigquery.LoadJob], timeout: Optional[float] = None) -> None:
+    """
+    Wait for load jobs returned by BigQueryDataWriter.write(await_completion=False).
+
+    Jobs are polled in turn with the writer's backoff, so the total wait is
+    bounded by the slowest job rather than the sum of all of them.
+
+    Args:
+        jobs: Load jobs to wait for
+        timeout: Optional maximum number of seconds to wait for all jobs
+
+    Raises:
+        TimeoutError: If the jobs are not done within timeout
+        RuntimeError: If any load job fails
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    for job in jobs:
+        try:
+            BigQueryDataWriter._poll_job(job, deadline)
+        except TimeoutError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"BigQuery load job {job.job_id} failed. Error: {str(e)}"
+            ) from e
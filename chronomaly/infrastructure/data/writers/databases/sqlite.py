@@ -6,10 +6,23 @@ import pandas as pd
 import sqlite3
 import os
 import re
-from typing import Optional, Dict, List, Callable
+import stat
+import threading
+import warnings
+from datetime import date, datetime, time
+from itertools import islice
+from typing import Optional, Dict, List, Callable, Any, Iterator, Tuple
 from ..base import DataWriter
 from chronomaly.shared import TransformableMixin
 
+# Only alphanumeric characters and underscores are allowed in table names
+_TABLE_NAME_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+# Table names that look like SQL keywords are rejected
+_SQL_KEYWORDS = frozenset(
+    {"select", "insert", "update", "delete", "drop", "create", "alter"}
+)
+
 
 class SQLiteDataWriter(DataWriter, TransformableMixin):
     """
@@ -21,7 +34,14 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
         if_exists: How to behave if table exists {'fail', 'replace', 'append'}
                    (default: 'replace')
         transformers: Optional dict of transformer lists to apply before/after writing
-        **kwargs: Additional arguments to pass to pandas.to_sql()
+        **kwargs: Additional write options:
+                  - dtype: Dict of column name to SQL type used when the table
+                    is created (as in pandas.to_sql())
+                  - chunksize: Number of rows inserted per executemany() batch
+                    (default: 10000)
+                  Any other pandas.to_sql() argument is deprecated. When one is
+                  given, writes go through pandas.to_sql() with all options,
+                  as in earlier versions, and a DeprecationWarning is emitted.
 
     Security Notes:
         - database_path is validated to prevent path traversal attacks.
@@ -29,13 +49,16 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
         - Only alphanumeric characters and underscores are allowed in table names.
     """
 
+    SUPPORTED_WRITE_OPTIONS = {"dtype", "chunksize"}
+    DEFAULT_CHUNKSIZE = 10_000
+
     def __init__(
         self,
         database_path: str,
         table_name: str,
         if_exists: str = "replace",
         transformers: Optional[Dict[str, List[Callable]]] = None,
-        **kwargs,
+        **kwargs: Any,
     ):
         if not database_path:
             raise ValueError("database_path cannot be empty")
@@ -43,9 +66,14 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
         # Resolve to absolute path
         abs_path = os.path.abspath(database_path)
 
-        # Ensure parent directory exists or can be created
+        # Ensure parent directory exists; one stat call covers existence and
+        # type, and like os.path.isdir() any stat error counts as missing
         parent_dir = os.path.dirname(abs_path)
-        if not os.path.exists(parent_dir):
+        try:
+            parent_stat = os.stat(parent_dir)
+        except OSError:
+            parent_stat = None
+        if parent_stat is None or not stat.S_ISDIR(parent_stat.st_mode):
             raise FileNotFoundError(f"Parent directory does not exist: {parent_dir}")
 
         # Check if parent directory is writable
@@ -58,23 +86,14 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
             raise ValueError("table_name cannot be empty")
 
         # Only allow alphanumeric characters and underscores
-        if not re.match(r"^[a-zA-Z0-9_]+$", table_name):
+        if not _TABLE_NAME_RE.fullmatch(table_name):
             raise ValueError(
                 f"Invalid table_name: '{table_name}'. "
                 "Only alphanumeric characters and underscores are allowed."
             )
 
         # Don't allow names that look like SQL keywords
-        sql_keywords = {
-            "select",
-            "insert",
-            "update",
-            "delete",
-            "drop",
-            "create",
-            "alter",
-        }
-        if table_name.lower() in sql_keywords:
+        if table_name.lower() in _SQL_KEYWORDS:
             raise ValueError(f"table_name cannot be a SQL keyword: '{table_name}'")
 
         self.table_name = table_name
@@ -86,9 +105,61 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
                 f"Must be one of: {valid_if_exists}"
             )
 
+        # Options only pandas.to_sql() understands keep the old to_sql() path
+        to_sql_options = set(kwargs) - self.SUPPORTED_WRITE_OPTIONS
+        if to_sql_options:
+            warnings.warn(
+                f"Passing {sorted(to_sql_options)} to SQLiteDataWriter is "
+                f"deprecated; writes fall back to pandas.to_sql(). Supported "
+                f"options: {sorted(self.SUPPORTED_WRITE_OPTIONS)}",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
+        chunksize = kwargs.get("chunksize", self.DEFAULT_CHUNKSIZE)
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got: {chunksize}")
+
         self.if_exists = if_exists
         self.transformers = transformers or {}
-        self.to_sql_kwargs = kwargs
+        self.dtype: Optional[Dict[str, str]] = kwargs.get("dtype")
+        self.chunksize: int = chunksize
+        self.to_sql_kwargs: Optional[Dict[str, Any]] = (
+            kwargs if to_sql_options else None
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Create and return the SQLite connection.
+
+        The connection is opened once and reused by subsequent write() calls.
+        It runs in WAL mode, so readers are not blocked while a write is in
+        progress and commits avoid the rollback journal's extra fsyncs.
+        Callers must hold self._lock.
+
+        Returns:
+            sqlite3.Connection: Open SQLite connection
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.database_path, check_same_thread=False, isolation_level=None
+            )
+            # Larger pages for new databases; page_size has no effect on an
+            # existing file and cannot change once the journal is WAL
+            conn.execute("PRAGMA page_size=32768")
+            # Write-oriented tuning: WAL journal with one fsync per checkpoint,
+            # 256 MiB memory-mapped I/O, in-memory temporary tables and a
+            # 256 MiB page cache
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-262144")
+            self._conn = conn
+
+        return self._conn
 
     def write(self, dataframe: pd.DataFrame) -> None:
         """
@@ -112,17 +183,45 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
         if dataframe.empty:
             raise ValueError("Cannot write empty DataFrame to database")
 
-        conn = None
         try:
-            conn = sqlite3.connect(self.database_path)
-
-            dataframe.to_sql(
-                name=self.table_name,
-                con=conn,
-                if_exists=self.if_exists,
-                index=False,
-                **self.to_sql_kwargs,
-            )
+            # The cached connection is shared, so one write runs at a time
+            with self._lock:
+                conn = self._get_connection()
+
+                if self.to_sql_kwargs is not None:
+                    dataframe.to_sql(
+                        name=self.table_name,
+                        con=conn,
+                        if_exists=self.if_exists,
+                        index=False,
+                        **self.to_sql_kwargs,
+                    )
+                    return
+
+                # Create/replace the table and insert all rows in one transaction
+                conn.execute("BEGIN")
+                try:
+                    self._prepare_table(conn, dataframe)
+
+                    columns = ", ".join(
+                        self._quote(column) for column in dataframe.columns
+                    )
+                    placeholders = ", ".join("?" * len(dataframe.columns))
+                    insert_sql = (
+                        f"INSERT INTO {self._quote(self.table_name)} ({columns}) "
+                        f"VALUES ({placeholders})"
+                    )
+
+                    rows = self._iter_rows(dataframe)
+                    while batch := list(islice(rows, self.chunksize)):
+                        conn.executemany(insert_sql, batch)
+
+                    conn.execute("COMMIT")
+                except BaseException:
+                    # SQLite may already have rolled back, e.g. on a full disk
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
 
         except sqlite3.Error as e:
             raise RuntimeError(
@@ -134,6 +233,117 @@ class SQLiteDataWriter(DataWriter, TransformableMixin):
                 f"Failed to write data to SQLite database "
                 f"'{self.database_path}': {str(e)}"
             ) from e
-        finally:
-            if conn is not None:
-                conn.close()
+
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+
+        This should be called when done using the writer, especially in
+        long-running applications to prevent resource leaks.
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+    def __enter__(self):
+        """Support for context manager protocol."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Ensure connection is closed when used as context manager."""
+        self.close()
+        return False
+
+    def _prepare_table(self, conn: sqlite3.Connection, dataframe: pd.DataFrame) -> None:
+        """
+        Make sure the target table exists according to if_exists.
+
+        New tables are created with the same column types pandas.to_sql()
+        would use.
+
+        Args:
+            conn: Open SQLite connection inside a transaction
+            dataframe: DataFrame that will be inserted
+
+        Raises:
+            ValueError: If the table exists and if_exists is 'fail'
+        """
+        table_exists = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (self.table_name,),
+            ).fetchone()
+            is not None
+        )
+
+        if table_exists:
+            if self.if_exists == "fail":
+                raise ValueError(f"Table '{self.table_name}' already exists.")
+            if self.if_exists == "append":
+                return
+            conn.execute(f"DROP TABLE {self._quote(self.table_name)}")
+
+        conn.execute(
+            pd.io.sql.get_schema(dataframe, self.table_name, con=conn, dtype=self.dtype)
+        )
+
+    @staticmethod
+    def _iter_rows(dataframe: pd.DataFrame) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate DataFrame rows as tuples of SQLite-compatible values.
+
+        Values are converted column by column the same way pandas.to_sql()
+        stores them: missing values as NULL, booleans as integers, timedeltas
+        as integer nanoseconds and dates/times/timestamps as ISO-8601 text.
+
+        Args:
+            dataframe: DataFrame to convert
+
+        Returns:
+            Iterator of row tuples
+        """
+        columns = []
+        for _, series in dataframe.items():
+            missing = series.isna()
+            if pd.api.types.is_datetime64_any_dtype(series):
+                series = series.map(
+                    lambda value: value.isoformat(" "), na_action="ignore"
+                )
+            elif pd.api.types.is_timedelta64_dtype(series):
+                series = series.fillna(pd.Timedelta(0)).astype("int64")
+            elif pd.api.types.is_bool_dtype(series):
+                series = series.astype(int)
+            elif pd.api.types.is_object_dtype(series):
+                series = series.map(_adapt_value, na_action="ignore")
+
+            values = series.astype(object)
+            columns.append(values.where(~missing, None).tolist())
+
+        return zip(*columns)
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        """Quote an SQL identifier."""
+        return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _adapt_value(value: Any) -> Any:
+    """
+    Convert date/time objects to ISO-8601 text for SQLite.
+
+    Args:
+        value: Cell value from an object column
+
+    Returns:
+        Any: ISO-8601 string for date/time values, otherwise the value itself
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, time):
+        return value.strftime("%H:%M:%S.%f")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
@@ -0,0 +1,7 @@
+"""
+File data writers.
+"""
+
+from .parquet import ParquetDataWriter
+
+__all__ = ["ParquetDataWriter"]
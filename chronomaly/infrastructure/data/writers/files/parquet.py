@@ -0,0 +1,116 @@
+"""
+Parquet data writer implementation.
+"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Optional, Dict, List, Callable, Any
+from ..base import DataWriter
+from chronomaly.shared import TransformableMixin
+
+
+class ParquetDataWriter(DataWriter, TransformableMixin):
+    """
+    Data writer implementation for Parquet files.
+
+    Parquet is a columnar format, so it is a better fit than SQLite when the
+    written results are consumed by analytic queries (pandas, PyArrow, DuckDB).
+
+    Args:
+        file_path: Path to the Parquet file
+        if_exists: How to behave if the file exists {'fail', 'replace'}
+                   (default: 'replace')
+        compression: Parquet compression codec (default: 'zstd')
+        transformers: Optional dict of transformer lists to apply before/after writing
+        **kwargs: Additional arguments to pass to pyarrow.parquet.write_table()
+
+    Security Notes:
+        - file_path is validated to prevent path traversal attacks.
+        - Only writable parent directories are accepted.
+    """
+
+    VALID_IF_EXISTS = {"fail", "replace"}
+    VALID_COMPRESSIONS = {"none", "snappy", "gzip", "brotli", "lz4", "zstd"}
+
+    def __init__(
+        self,
+        file_path: str,
+        if_exists: str = "replace",
+        compression: str = "zstd",
+        transformers: Optional[Dict[str, List[Callable]]] = None,
+        **kwargs: Any,
+    ):
+        if not file_path:
+            raise ValueError("file_path cannot be empty")
+
+        # Resolve to absolute path
+        abs_path = os.path.abspath(file_path)
+
+        parent_dir = os.path.dirname(abs_path)
+        if not os.path.isdir(parent_dir):
+            raise FileNotFoundError(f"Parent directory does not exist: {parent_dir}")
+
+        # Check if parent directory is writable
+        if not os.access(parent_dir, os.W_OK):
+            raise PermissionError(f"Parent directory is not writable: {parent_dir}")
+
+        if if_exists not in self.VALID_IF_EXISTS:
+            raise ValueError(
+                f"Invalid if_exists: '{if_exists}'. "
+                f"Must be one of: {', '.join(sorted(self.VALID_IF_EXISTS))}"
+            )
+
+        if compression.lower() not in self.VALID_COMPRESSIONS:
+            raise ValueError(
+                f"Invalid compression: '{compression}'. "
+                f"Must be one of: {', '.join(sorted(self.VALID_COMPRESSIONS))}"
+            )
+
+        self.file_path = abs_path
+        self.if_exists = if_exists
+        self.compression = compression.lower()
+        self.transformers = transformers or {}
+        self.write_table_kwargs = kwargs
+
+    def write(self, dataframe: pd.DataFrame) -> None:
+        """
+        Write forecast results to the Parquet file.
+
+        Args:
+            dataframe: The forecast results as a pandas DataFrame
+
+        Raises:
+            TypeError: If dataframe is not a pandas DataFrame
+            ValueError: If dataframe is empty or the file exists and
+                        if_exists is 'fail'
+            RuntimeError: If the file cannot be written
+        """
+        # Apply transformers before writing data
+        dataframe = self._apply_transformers(dataframe, "before")
+
+        if not isinstance(dataframe, pd.DataFrame):
+            raise TypeError(
+                f"Expected pandas DataFrame, got {type(dataframe).__name__}"
+            )
+
+        if dataframe.empty:
+            raise ValueError("Cannot write empty DataFrame")
+
+        if self.if_exists == "fail" and os.path.exists(self.file_path):
+            raise ValueError(f"File '{self.file_path}' already exists.")
+
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            pq.write_table(
+                table,
+                self.file_path,
+                compression=self.compression,
+                **self.write_table_kwargs,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to write Parquet file '{self.file_path}': {str(e)}"
+            ) from e
@@ -2,12 +2,16 @@
 TimesFM forecaster implementation.
 """
 
+import contextlib
 import os
+import threading
+import warnings
+from collections import OrderedDict
 
 import pandas as pd
 import numpy as np
 import torch
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, Iterator, List, Callable, Tuple
 from .base import Forecaster
 from chronomaly.shared import TransformableMixin
 
@@ -19,6 +23,15 @@ except ImportError:
         "Install it with: pip install timesfm"
     )
 
+# Offset from the last observed date to the first forecast date for the most
+# common frequencies; other frequencies use their pandas offset
+_START_OFFSETS = {
+    "D": pd.Timedelta(days=1),
+    "H": pd.Timedelta(hours=1),
+    "W": pd.Timedelta(weeks=1),
+    "M": pd.DateOffset(months=1),
+}
+
 
 class TimesFMForecaster(Forecaster, TransformableMixin):
     """
@@ -40,11 +53,40 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         fix_quantile_crossing: Fix quantile crossing (default: True)
         frequency: Pandas frequency string for forecast dates (default: 'D' for daily)
                   Common values: 'D' (daily), 'H' (hourly), 'W' (weekly), 'M' (monthly)
+        use_torch_compile: Wrap the underlying PyTorch module with torch.compile
+                           and warm it up when the model is loaded. Pays off
+                           for repeated forecasts in one process; the first
+                           load takes noticeably longer (default: False)
+        autocast_dtype: Run inference under torch.autocast with this reduced
+                        precision dtype (torch.bfloat16 or torch.float16).
+                        Halves activation bandwidth on hardware with bf16/fp16
+                        support at a small cost in accuracy (default: None,
+                        full float32 inference)
+        device: Device to run the model on, e.g. 'cpu', 'cuda' or 'cuda:1'.
+                'auto' uses CUDA when available, otherwise CPU (default: 'auto')
+        date_as_python_date: Return the forecast 'date' column as Python
+                             datetime.date objects. Set to False to keep it
+                             as datetime64, which avoids one Python object
+                             per row and keeps vectorized date operations
+                             available (default: True)
+        preload: Start loading (and, with use_torch_compile, compiling) the
+                 model on a background thread at construction, so the first
+                 forecast() doesn't pay that cost. forecast() waits for a
+                 load that is still in progress (default: False)
         transformers: Optional dict of transformer lists to apply
                       before/after forecasting
         **kwargs: Additional configuration parameters
+
+    Loaded models are cached at class level, keyed by model name and
+    configuration, so forecasters created with the same settings share one
+    model instead of loading and compiling it again.
     """
 
+    # Loaded models shared by all instances, least recently used first
+    MODEL_CACHE_SIZE = 4
+    _MODEL_CACHE: OrderedDict[Tuple[Any, ...], Tuple[Any, Any]] = OrderedDict()
+    _MODEL_CACHE_LOCK = threading.Lock()
+
     def __init__(
         self,
         model_name: str = "google/timesfm-2.5-200m-pytorch",
@@ -57,13 +99,38 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         infer_is_positive: bool = True,
         fix_quantile_crossing: bool = True,
         frequency: str = "D",
+        use_torch_compile: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None,
+        device: str = "auto",
+        date_as_python_date: bool = True,
+        preload: bool = False,
         transformers: Optional[Dict[str, List[Callable]]] = None,
         **kwargs: Any,
     ):
         self.model_name: str = model_name
         self.hf_token: str | None = hf_token or os.getenv("HF_TOKEN")
+        self.max_context: int = max_context
         self.max_horizon: int = max_horizon
         self.frequency: str = frequency
+        self._start_offset: Any = (
+            _START_OFFSETS[frequency]
+            if frequency in _START_OFFSETS
+            else pd.tseries.frequencies.to_offset(frequency)
+        )
+        self.use_torch_compile: bool = use_torch_compile
+        if autocast_dtype not in (None, torch.bfloat16, torch.float16):
+            raise ValueError(
+                f"autocast_dtype must be None, torch.bfloat16 or torch.float16, "
+                f"got {autocast_dtype}"
+            )
+        self.autocast_dtype: torch.dtype | None = autocast_dtype
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        try:
+            self.device: torch.device = torch.device(device)
+        except (RuntimeError, TypeError) as e:
+            raise ValueError(f"Invalid device '{device}': {str(e)}") from e
+        self.date_as_python_date: bool = date_as_python_date
         self.transformers: dict[str, list[Callable]] = transformers or {}
         self.config: Any = timesfm.ForecastConfig(
             max_context=max_context,
@@ -76,24 +143,186 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
             **kwargs,
         )
         self._model: Any | None = None
+        self._compiled_model: torch.nn.Module | None = None
+
+        self._preload_thread: threading.Thread | None = None
+        if preload:
+            self._preload_thread = threading.Thread(
+                target=self._preload_model, name="timesfm-preload", daemon=True
+            )
+            self._preload_thread.start()
 
     def _get_model(self) -> Any:
         """
         Initialize and compile TimesFM model.
 
+        The model is taken from the class-level cache when another forecaster
+        already loaded it with the same model name and configuration.
+
         Returns:
             Compiled TimesFM model
         """
         if self._model is None:
-            torch.set_float32_matmul_precision("high")
+            key = self._model_cache_key()
+            cache = TimesFMForecaster._MODEL_CACHE
+
+            # Held while loading so concurrent callers don't load the same model
+            with TimesFMForecaster._MODEL_CACHE_LOCK:
+                entry = cache.get(key)
+                if entry is None:
+                    entry = self._load_model()
+                    cache[key] = entry
+                    while len(cache) > self.MODEL_CACHE_SIZE:
+                        cache.popitem(last=False)
+                else:
+                    cache.move_to_end(key)
+
+            self._model, self._compiled_model = entry
+
+        return self._model
+
+    def _preload_model(self) -> None:
+        """
+        Load the model in the background.
 
-            self._model = timesfm.TimesFM_2p5_200M_torch.from_pretrained(
-                self.model_name,
-                token=self.hf_token,
+        A concurrent forecast() blocks on the model cache lock until this
+        load finishes. Failures are only warned about; forecast() then loads
+        the model itself and raises the error.
+        """
+        try:
+            self._get_model()
+        except Exception as e:
+            warnings.warn(
+                f"TimesFM model preload failed, it will be loaded on the first "
+                f"forecast instead: {str(e)}"
             )
-            self._model.compile(self.config)
 
-        return self._model
+    def _model_cache_key(self) -> Tuple[Any, ...]:
+        """
+        Build the model cache key from everything that affects the loaded model.
+
+        Returns:
+            Tuple[Any, ...]: Hashable cache key
+        """
+        return (
+            self.model_name,
+            self.use_torch_compile,
+            self.autocast_dtype,
+            str(self.device),
+            tuple(sorted(vars(self.config).items())),
+        )
+
+    def _load_model(self) -> Tuple[Any, Optional[torch.nn.Module]]:
+        """
+        Load and compile a TimesFM model.
+
+        Returns:
+            Tuple of the compiled TimesFM model and its torch.compile'd module
+            (None unless use_torch_compile is set and compilation succeeded)
+        """
+        torch.set_float32_matmul_precision("high")
+
+        model = timesfm.TimesFM_2p5_200M_torch.from_pretrained(
+            self.model_name,
+            token=self.hf_token,
+        )
+        self._move_to_device(model)
+        model.compile(self.config)
+
+        compiled_model = None
+        if self.use_torch_compile:
+            compiled_model = self._compile_torch_module(model)
+
+        return model, compiled_model
+
+    def _move_to_device(self, model: Any) -> None:
+        """
+        Place the underlying PyTorch module on the configured device.
+
+        TimesFM moves inputs to the device recorded on its module, so that
+        attribute is updated along with the weights.
+
+        Args:
+            model: Loaded TimesFM model
+        """
+        module = getattr(model, "model", None)
+        if not isinstance(module, torch.nn.Module):
+            return
+
+        module.to(self.device)
+        if hasattr(module, "device"):
+            module.device = self.device
+
+    @classmethod
+    def clear_model_cache(cls) -> None:
+        """
+        Drop all cached models so their memory can be released.
+
+        Forecasters that already hold a model keep using it.
+        """
+        with cls._MODEL_CACHE_LOCK:
+            cls._MODEL_CACHE.clear()
+
+    def _compile_torch_module(self, model: Any) -> Optional[torch.nn.Module]:
+        """
+        Wrap the forward pass of the underlying PyTorch module with torch.compile.
+
+        A warm-up forecast with max_context/max_horizon triggers compilation
+        here, so the first forecast() call already runs the compiled graph.
+        dynamic=True avoids recompiling for every new context length. If
+        compilation fails, the model keeps running eagerly and a warning is
+        emitted.
+
+        Args:
+            model: Loaded and compiled TimesFM model
+
+        Returns:
+            Optional[torch.nn.Module]: The compiled module, or None if the
+            model runs eagerly
+        """
+        module = getattr(model, "model", None)
+        if not isinstance(module, torch.nn.Module):
+            warnings.warn(
+                "TimesFM model does not expose a PyTorch module; "
+                "skipping torch.compile"
+            )
+            return None
+
+        eager_forward = module.forward
+        try:
+            module.forward = torch.compile(
+                eager_forward, mode="reduce-overhead", fullgraph=False, dynamic=True
+            )
+            with self._inference_context():
+                model.forecast(
+                    horizon=self.max_horizon,
+                    inputs=[np.ones(self.max_context, dtype=np.float32)],
+                )
+        except Exception as e:
+            module.forward = eager_forward
+            warnings.warn(
+                f"torch.compile failed, falling back to eager execution: {str(e)}"
+            )
+            return None
+
+        return module
+
+    @contextlib.contextmanager
+    def _inference_context(self) -> Iterator[None]:
+        """
+        Context that model calls run under.
+
+        Inference mode skips autograd bookkeeping; autocast is added when
+        autocast_dtype is set.
+        """
+        with torch.inference_mode():
+            if self.autocast_dtype is None:
+                yield
+            else:
+                with torch.autocast(
+                    device_type=self.device.type, dtype=self.autocast_dtype
+                ):
+                    yield
 
     def forecast(
         self, dataframe: pd.DataFrame, horizon: int, return_point: bool = False
@@ -111,7 +340,8 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
 
         Raises:
             TypeError: If dataframe is not a pandas DataFrame
-            ValueError: If dataframe is empty, has no columns, or horizon is invalid
+            ValueError: If dataframe is empty, has no columns, has non-numeric
+                        columns, or horizon is invalid
         """
         if not isinstance(dataframe, pd.DataFrame):
             raise TypeError(
@@ -141,28 +371,44 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         # Apply transformers before forecasting (on input data)
         dataframe = self._apply_transformers(dataframe, "before")
 
+        # Resolve the forecast start once, before running the model, so index
+        # problems fail fast
+        last_date = self._get_last_date(dataframe)
+
         model = self._get_model()
 
-        # Prepare inputs - each column is a separate time series
-        inputs = [dataframe[column].values for column in dataframe.columns]
+        # Prepare inputs - each column is a separate time series. All columns
+        # are converted in one pass into a C-contiguous (series, time) float32
+        # block, and every series is passed as a row view of that block so the
+        # model receives the whole batch in a single forecast call.
+        try:
+            series_block = np.ascontiguousarray(
+                dataframe.to_numpy(dtype=np.float32, na_value=np.nan).T
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"All columns must be numeric to forecast: {str(e)}"
+            ) from e
+        inputs = list(series_block)
 
         # Generate forecasts
         try:
-            forecast_point, forecast_quantile = model.forecast(
-                horizon=horizon, inputs=inputs
-            )
+            with self._inference_context():
+                forecast_point, forecast_quantile = model.forecast(
+                    horizon=horizon, inputs=inputs
+                )
         except Exception as e:
             raise RuntimeError(f"TimesFM forecast failed: {str(e)}") from e
 
         if return_point:
             # Return point forecasts
             forecast_df = self._format_point_forecast(
-                forecast_point, dataframe, horizon
+                forecast_point, dataframe, horizon, last_date
             )
         else:
             # Return quantile forecasts (default)
             forecast_df = self._format_quantile_forecast(
-                forecast_quantile, dataframe, horizon
+                forecast_quantile, dataframe, horizon, last_date
             )
 
         # Apply transformers after forecasting
@@ -185,7 +431,9 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         Raises:
             ValueError: If index cannot be converted to datetime or dataframe is empty
         """
-        if dataframe.empty or len(dataframe) == 0:
+        # forecast() checks emptiness before its transformers run, so this
+        # guards against "before" transformers that drop every row
+        if dataframe.empty:
             raise ValueError("Cannot get last date from empty DataFrame")
 
         # Get the last index value
@@ -197,15 +445,16 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
 
         # Check if it's a MultiIndex
         if isinstance(dataframe.index, pd.MultiIndex):
-            # Try to find a date level in the MultiIndex
-            for level_idx in range(dataframe.index.nlevels):
-                level_values = dataframe.index.get_level_values(level_idx)
+            # Try to find a date level in the MultiIndex. Only the last index
+            # tuple is inspected; get_level_values() would materialize each
+            # level for every row just to read its final value.
+            for level_idx, level in enumerate(dataframe.index.levels):
                 try:
                     # Try to convert this level to datetime
-                    if isinstance(level_values, pd.DatetimeIndex):
-                        return level_values[-1]
+                    if isinstance(level, pd.DatetimeIndex):
+                        return last_idx[level_idx]
                     else:
-                        return pd.to_datetime(level_values[-1])
+                        return pd.to_datetime(last_idx[level_idx])
                 except (ValueError, TypeError):
                     continue
 
@@ -227,8 +476,42 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
                 f"Original error: {str(e)}"
             )
 
+    def _forecast_dates(
+        self, last_date: pd.Timestamp, periods: int
+    ) -> pd.DatetimeIndex:
+        """
+        Generate the dates of the forecast periods.
+
+        Args:
+            last_date: Last date of the input data
+            periods: Number of forecast periods
+
+        Returns:
+            pd.DatetimeIndex: Forecast dates starting one period after last_date
+        """
+        return pd.date_range(
+            start=last_date + self._start_offset, periods=periods, freq=self.frequency
+        )
+
+    def _date_column(self, dates: pd.DatetimeIndex) -> Any:
+        """
+        Convert forecast dates to the values of the output 'date' column.
+
+        Args:
+            dates: Forecast dates
+
+        Returns:
+            datetime.date object array if date_as_python_date is set,
+            otherwise the DatetimeIndex itself
+        """
+        return dates.date if self.date_as_python_date else dates
+
     def _format_point_forecast(
-        self, forecast_point: np.ndarray, dataframe: pd.DataFrame, horizon: int
+        self,
+        forecast_point: np.ndarray,
+        dataframe: pd.DataFrame,
+        horizon: int,
+        last_date: pd.Timestamp,
     ) -> pd.DataFrame:
         """
         Format point forecast results.
@@ -237,6 +520,7 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
             forecast_point: Point forecast array from TimesFM
             dataframe: Original input dataframe
             horizon: Forecast horizon
+            last_date: Last date of the input data (from _get_last_date())
 
         Returns:
             pd.DataFrame: Formatted forecast with date column
@@ -244,35 +528,21 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         forecast_data = forecast_point.T
 
         # Generate future dates
-        last_date = self._get_last_date(dataframe)
-
-        # Calculate the appropriate offset based on frequency
-        if self.frequency == "D":
-            start_date = last_date + pd.Timedelta(days=1)
-        elif self.frequency == "H":
-            start_date = last_date + pd.Timedelta(hours=1)
-        elif self.frequency == "W":
-            start_date = last_date + pd.Timedelta(weeks=1)
-        elif self.frequency == "M":
-            start_date = last_date + pd.DateOffset(months=1)
-        else:
-            # For other frequencies, use pd.date_range to calculate offset
-            start_date = last_date + pd.tseries.frequencies.to_offset(self.frequency)
-
-        new_index = pd.date_range(
-            start=start_date, periods=horizon, freq=self.frequency
-        )
+        new_index = self._forecast_dates(last_date, horizon)
 
         # Create forecast dataframe
         dataframe_forecast = pd.DataFrame(forecast_data, columns=dataframe.columns)
         dataframe_forecast.columns.name = None
-        dataframe_forecast.insert(0, "date", new_index)
-        dataframe_forecast["date"] = dataframe_forecast["date"].dt.date
+        dataframe_forecast.insert(0, "date", self._date_column(new_index))
 
         return dataframe_forecast
 
     def _format_quantile_forecast(
-        self, forecast_quantile: np.ndarray, dataframe: pd.DataFrame, horizon: int
+        self,
+        forecast_quantile: np.ndarray,
+        dataframe: pd.DataFrame,
+        horizon: int,
+        last_date: pd.Timestamp,
     ) -> pd.DataFrame:
         """
         Format quantile forecast results.
@@ -283,60 +553,37 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
             forecast_quantile: Quantile forecast array from TimesFM
             dataframe: Original input dataframe
             horizon: Forecast horizon
+            last_date: Last date of the input data (from _get_last_date())
 
         Returns:
             pd.DataFrame: Formatted forecast with date column and quantile values
         """
+        forecast_quantile = np.asarray(forecast_quantile)
         (
             forecast_quantile_items,
             forecast_quantile_horizons,
             forecast_quantile_quantiles,
         ) = forecast_quantile.shape
 
-        # Format quantiles as pipe-separated strings
-        forecast_data = []
-
-        for forecast_quantile_item in range(forecast_quantile_items):
-            forecast_data_row = []
-
-            for forecast_quantile_horizon in range(forecast_quantile_horizons):
-                cell_value = "|".join(
-                    map(
-                        str,
-                        forecast_quantile[
-                            forecast_quantile_item, forecast_quantile_horizon, :
-                        ],
-                    )
-                )
-                forecast_data_row.append(cell_value)
-
-            forecast_data.append(forecast_data_row)
+        # Format quantiles as pipe-separated strings. astype(str) converts all
+        # values in one pass and renders each one exactly like str() would.
+        quantile_strings = forecast_quantile.astype(str).reshape(
+            -1, forecast_quantile_quantiles
+        )
+        cells = ["|".join(row) for row in quantile_strings.tolist()]
 
-        forecast_data = np.array(forecast_data, dtype=object).T
+        forecast_data = (
+            np.array(cells, dtype=object)
+            .reshape(forecast_quantile_items, forecast_quantile_horizons)
+            .T
+        )
 
         # Generate future dates
-        last_date = self._get_last_date(dataframe)
-
-        # Calculate the appropriate offset based on frequency
-        if self.frequency == "D":
-            start_date = last_date + pd.Timedelta(days=1)
-        elif self.frequency == "H":
-            start_date = last_date + pd.Timedelta(hours=1)
-        elif self.frequency == "W":
-            start_date = last_date + pd.Timedelta(weeks=1)
-        elif self.frequency == "M":
-            start_date = last_date + pd.DateOffset(months=1)
-        else:
-            start_date = last_date + pd.tseries.frequencies.to_offset(self.frequency)
-
-        new_index = pd.date_range(
-            start=start_date, periods=forecast_quantile_horizons, freq=self.frequency
-        )
+        new_index = self._forecast_dates(last_date, forecast_quantile_horizons)
 
         # Create forecast dataframe
         dataframe_forecast = pd.DataFrame(forecast_data, columns=dataframe.columns)
         dataframe_forecast.columns.name = None
-        dataframe_forecast.insert(0, "date", new_index)
-        dataframe_forecast["date"] = dataframe_forecast["date"].dt.date
+        dataframe_forecast.insert(0, "date", self._date_column(new_index))
 
         return dataframe_forecast
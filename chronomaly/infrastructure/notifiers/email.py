@@ -2,17 +2,83 @@
 Email notifier implementation.
 """
 
+import base64
+import functools
+import html
 import smtplib
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+import numpy as np
 import pandas as pd
+from email.mime.image import MIMEImage
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any, Optional, Callable
-from jinja2 import Template, TemplateSyntaxError
+from jinja2 import Environment, Template, TemplateSyntaxError
 from .base import Notifier
 from chronomaly.shared import TransformableMixin
 
+# Required {{ table }} placeholder in email templates ({{ table }} or {{table}})
+_TABLE_PLACEHOLDER_RE = re.compile(r"\{\{\s*table\s*\}\}")
+# {date:FORMAT} placeholders in the email subject
+_DATE_FORMAT_RE = re.compile(r"\{date:([^}]+)\}")
+# Base64 data URI images, e.g. charts added to the table by transformers
+_DATA_URI_IMAGE_RE = re.compile(r"data:image/(png|jpeg|gif);base64,([A-Za-z0-9+/=]+)")
+# Longest line, without CRLF, that SMTP allows (RFC 5321)
+_MAX_LINE_LENGTH = 998
+
+# Inline styles for the anomaly table (inline so email clients keep them).
+# Kept minified: the cell styles are repeated in every header and data cell.
+_TABLE_STYLE = "border-collapse:collapse;width:100%"
+_TH_STYLE = "background-color:#f0f0f0;border:1px solid #ddd;padding:8px;text-align:left"
+_TD_STYLE = "border:1px solid #ddd;padding:8px"
+
+# Markup fragments joined around pre-formatted cell values
+_TH_OPEN = f'<th style="{_TH_STYLE}">'
+_TD_OPEN = f'<td style="{_TD_STYLE}">'
+_HEADER_SEP = "</th>" + _TH_OPEN
+_CELL_SEP = "</td>" + _TD_OPEN
+_ROW_OPEN = "<tr>" + _TD_OPEN
+# Rows end with a newline so the body stays within SMTP's line length limit
+_ROW_CLOSE = "</td></tr>\n"
+
+# Inferred column types that astype(str) renders exactly like str() per value.
+# Any other column may hold floats that need precision formatting
+_STR_INFERRED_TYPES = frozenset({"string", "integer", "boolean", "empty"})
+
+
+def _has_long_line(text: str) -> bool:
+    """
+    Check whether any line of text is too long to send over SMTP unencoded.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        bool: True if a line exceeds the SMTP line length limit
+    """
+    lines = text.replace("\r", "\n").split("\n")
+    return max(map(len, lines)) > _MAX_LINE_LENGTH
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template_content: str) -> Template:
+    """
+    Compile an email template, sharing the result between notifiers.
+
+    Keyed on the template source, so notifiers built from the same template
+    file (e.g. one per alert rule) compile it only once.
+
+    Args:
+        template_content: Jinja2 template source
+
+    Returns:
+        Template: Compiled template
+    """
+    return Template(template_content)
+
 
 class EmailNotifier(Notifier, TransformableMixin):
     """
@@ -36,6 +102,14 @@ class EmailNotifier(Notifier, TransformableMixin):
         template_variables: Optional dict of custom variables to pass to the template.
                            These can be used in the template with Jinja2 syntax.
                            Reserved names (table, count, plural) are silently ignored.
+        escape_html: HTML-escape table headers and cell values. Enable when
+                     anomaly data may contain untrusted text; leave disabled
+                     to render HTML added by transformers, such as chart img
+                     tags (default: False)
+        attach_images: Send base64 data URI images in the HTML (such as charts
+                       from TimeSeriesVisualizer) as inline MIME attachments
+                       referenced by cid: instead. Many email clients, Gmail
+                       included, don't display data URI images (default: False)
         transformers: Optional transformers to apply before notification
 
     Note:
@@ -44,6 +118,21 @@ class EmailNotifier(Notifier, TransformableMixin):
 
         Charts can be included by adding a column with HTML img tags via transformers.
         Use TimeSeriesVisualizer to generate base64 chart images.
+
+        Each notify() opens its own SMTP connection. When sending several
+        notifications, use the notifier as a context manager to reuse one
+        authenticated session until the block exits:
+
+            with EmailNotifier(to=..., template_path=...) as notifier:
+                for payload in payloads:
+                    notifier.notify(payload)
+
+        notify_many(payloads) does the same for a list of payloads.
+
+        notify_async(payload) queues a notification on a background thread
+        and returns a Future, so callers aren't blocked by the SMTP dialog.
+        Queued notifications are sent in order; call flush() or close() to
+        wait for them.
     """
 
     def __init__(
@@ -52,6 +141,8 @@ class EmailNotifier(Notifier, TransformableMixin):
         template_path: str,
         subject: Optional[str] = None,
         template_variables: Optional[Dict[str, Any]] = None,
+        escape_html: bool = False,
+        attach_images: bool = False,
         transformers: Optional[Dict[str, list[Callable]]] = None,
     ):
         # Validate and normalize recipients
@@ -60,21 +151,27 @@ class EmailNotifier(Notifier, TransformableMixin):
         elif isinstance(to, list):
             if not to:
                 raise ValueError("Recipient list cannot be empty")
-            if not all(isinstance(email, str) for email in to):
+            # Check each distinct element type once instead of every element
+            if not all(issubclass(t, str) for t in {type(email) for email in to}):
                 raise TypeError("All recipients must be strings")
             self.to: list[str] = to
         else:
             raise TypeError("'to' must be a string or list of strings")
+        self._to_header: str = ", ".join(self.to)
 
         self.transformers: dict[str, list[Callable]] = transformers or {}
         self._subject_template: str | None = subject
         self._template_variables: dict[str, Any] = template_variables or {}
+        self.escape_html: bool = escape_html
+        self.attach_images: bool = attach_images
 
         # Load and validate template (fail fast)
         import os
 
         self._template_content = self._load_and_validate_template(template_path)
         self._template_path = os.path.abspath(template_path)
+        # Compiled once; the template source doesn't change after loading
+        self._template: Template = _compile_template(self._template_content)
 
         # Get SMTP configuration from internal method
         smtp_config = self._get_smtp_config()
@@ -88,6 +185,14 @@ class EmailNotifier(Notifier, TransformableMixin):
         # Validate SMTP credentials
         self._validate_smtp_config()
 
+        # Persistent SMTP session, only kept while used as a context manager
+        self._keep_connection: bool = False
+        self._smtp_conn: Optional[smtplib.SMTP] = None
+        # Serializes use of the shared session between threads
+        self._smtp_lock = threading.Lock()
+        # Background sender for notify_async(), created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     def _get_smtp_config(self) -> Dict[str, Any]:
         """
         Get SMTP configuration from environment variables.
@@ -100,12 +205,15 @@ class EmailNotifier(Notifier, TransformableMixin):
         """
         import os
 
+        # Read on every construction, not cached: the environment may be
+        # populated (e.g. from a .env file) after this module is imported
+        user = os.getenv("SMTP_USER", "")
         return {
             "host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
             "port": int(os.getenv("SMTP_PORT", "587")),
-            "user": os.getenv("SMTP_USER", ""),
+            "user": user,
             "password": os.getenv("SMTP_PASSWORD", ""),
-            "from_email": os.getenv("SMTP_FROM_EMAIL", os.getenv("SMTP_USER", "")),
+            "from_email": os.getenv("SMTP_FROM_EMAIL", user),
             "use_tls": os.getenv("SMTP_USE_TLS", "True").lower()
             in ("true", "1", "yes"),
         }
@@ -201,7 +309,7 @@ class EmailNotifier(Notifier, TransformableMixin):
 
         # Validate Jinja2 syntax
         try:
-            Template(template_content)
+            Environment().parse(template_content)
         except TemplateSyntaxError as e:
             raise ValueError(
                 f"Invalid Jinja2 template syntax: {str(e)}. "
@@ -210,9 +318,7 @@ class EmailNotifier(Notifier, TransformableMixin):
 
         # Validate required placeholders are present
         # Only {{ table }} is required - {{ count }} and {{ plural }} are optional
-        # Check for Jinja2 syntax: {{ table }} or {{table}}
-        import re
-        if not re.search(r"\{\{\s*table\s*\}\}", template_content):
+        if not _TABLE_PLACEHOLDER_RE.search(template_content):
             raise ValueError(
                 "Email template is missing required placeholder: {{ table }}. "
                 "This placeholder is required to display anomaly data."
@@ -239,14 +345,11 @@ class EmailNotifier(Notifier, TransformableMixin):
 
         # Replace {date} placeholders if anomaly_date is provided
         if anomaly_date is not None:
-            # Replace {date:FORMAT} placeholders with custom format
-            date_format_pattern = r"\{date:([^}]+)\}"
-            matches = re.finditer(date_format_pattern, subject)
-            for match in matches:
+            # Replace {date:FORMAT} placeholders with custom format in one pass
+            def format_date(match: re.Match) -> str:
                 format_string = match.group(1)
                 try:
-                    formatted_date = anomaly_date.strftime(format_string)
-                    subject = subject.replace(match.group(0), formatted_date)
+                    return anomaly_date.strftime(format_string)
                 except (ValueError, TypeError) as e:
                     import warnings
 
@@ -254,13 +357,15 @@ class EmailNotifier(Notifier, TransformableMixin):
                         f"Invalid date format '{format_string}' in email subject. "
                         f"Error: {str(e)}"
                     )
+                    return match.group(0)
+
+            subject = _DATE_FORMAT_RE.sub(format_date, subject)
 
             # Replace simple {date} placeholder (must be done after custom formats)
             subject = subject.replace("{date}", anomaly_date.strftime("%Y-%m-%d"))
 
         return subject
 
-
     def notify(self, payload: Dict[str, Any]) -> None:
         """
         Send email notification with anomaly data.
@@ -289,8 +394,11 @@ class EmailNotifier(Notifier, TransformableMixin):
         anomaly_date = None
         if "date" in anomalies_df.columns:
             try:
-                # Try to get the most recent (max) date from the data
-                date_series = pd.to_datetime(anomalies_df["date"])
+                # Try to get the most recent (max) date from the data; only
+                # columns that aren't datetime64 yet need converting first
+                date_series = anomalies_df["date"]
+                if not pd.api.types.is_datetime64_any_dtype(date_series):
+                    date_series = pd.to_datetime(date_series)
                 anomaly_date = date_series.max()
                 # Check if result is NaT (happens when all dates are NaT)
                 if pd.isna(anomaly_date):
@@ -306,9 +414,6 @@ class EmailNotifier(Notifier, TransformableMixin):
                 )
                 anomaly_date = None
 
-        # Store anomaly_date for use in _send_email
-        self._current_anomaly_date = anomaly_date
-
         # Apply transformers (e.g., filter only significant anomalies, select columns)
         filtered_df = self._apply_transformers(anomalies_df, "before")
 
@@ -320,7 +425,57 @@ class EmailNotifier(Notifier, TransformableMixin):
         html_body = self._generate_html_body(filtered_df)
 
         # Send email
-        self._send_email(html_body)
+        self._send_email(html_body, anomaly_date)
+
+    def notify_many(self, payloads: list[Dict[str, Any]]) -> None:
+        """
+        Send one email per payload over a single SMTP session.
+
+        The session is opened for the first message and closed afterwards,
+        unless the notifier is already being used as a context manager, in
+        which case its connection is reused and left open.
+
+        Args:
+            payloads: Payloads accepted by notify(), sent in order
+
+        Raises:
+            ValueError: If a payload doesn't contain required data
+            RuntimeError: If email sending fails
+        """
+        if self._keep_connection:
+            for payload in payloads:
+                self.notify(payload)
+            return
+
+        with self:
+            for payload in payloads:
+                self.notify(payload)
+
+    def notify_async(self, payload: Dict[str, Any]) -> Future:
+        """
+        Queue a notification to be sent on a background thread.
+
+        Notifications queued on the same notifier are sent one at a time in
+        submission order. Errors are not raised here; they are raised by the
+        returned Future's result().
+
+        Args:
+            payload: Payload accepted by notify()
+
+        Returns:
+            Future: Completes when the email has been sent
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="EmailNotifier"
+            )
+        return self._executor.submit(self.notify, payload)
+
+    def flush(self) -> None:
+        """Wait until all notifications queued by notify_async() are sent."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def _generate_html_body(self, df: pd.DataFrame) -> str:
         """
@@ -333,44 +488,10 @@ class EmailNotifier(Notifier, TransformableMixin):
         Returns:
             str: HTML content
         """
-        # Generate HTML table using pandas native function
-        # Generate HTML table with inline styles using pandas Styler
-        table_html = (
-            df.style.set_table_attributes('class="anomaly-table"')
-            .set_table_styles(
-                [
-                    {
-                        "selector": "th",
-                        "props": [
-                            ("background-color", "#f0f0f0"),
-                            ("border", "1px solid #ddd"),
-                            ("padding", "8px"),
-                            ("text-align", "left"),
-                        ],
-                    },
-                    {
-                        "selector": "td",
-                        "props": [
-                            ("border", "1px solid #ddd"),
-                            ("padding", "8px"),
-                        ],
-                    },
-                    {
-                        "selector": "table",
-                        "props": [
-                            ("border-collapse", "collapse"),
-                            ("width", "100%"),
-                        ],
-                    },
-                ]
-            )
-            .hide(axis="index")
-            .to_html(escape=False)
-        )
+        table_html = self._build_table_html(df)
 
         # Render Jinja2 template
         try:
-            template = Template(self._template_content)
             # Build context: start with custom variables, then override with built-ins
             # This ensures reserved names (table, count, plural) cannot be overridden
             context = dict(self._template_variables)
@@ -379,7 +500,7 @@ class EmailNotifier(Notifier, TransformableMixin):
                 "plural": "ies" if len(df) != 1 else "y",
                 "table": table_html,
             })
-            html = template.render(**context)
+            html = self._template.render(**context)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to render Jinja2 template: {str(e)}. "
@@ -388,12 +509,96 @@ class EmailNotifier(Notifier, TransformableMixin):
 
         return html
 
-    def _send_email(self, html_body: str) -> None:
+    def _build_table_html(self, df: pd.DataFrame) -> str:
+        """
+        Build the anomaly table as an HTML string.
+
+        Each column is formatted once as a whole (floats with pandas'
+        styler.format.precision, everything else via str()), then rows are
+        assembled with plain string joins. Cell values are only escaped when
+        escape_html is set, so HTML added by transformers (e.g. chart img
+        tags) is rendered as-is by default.
+
+        Args:
+            df: DataFrame with anomaly data
+
+        Returns:
+            str: HTML table
+        """
+        precision = pd.get_option("styler.format.precision")
+        columns = [
+            self._format_column(df.iloc[:, position], precision)
+            for position in range(df.shape[1])
+        ]
+        names = [str(name) for name in df.columns]
+        if self.escape_html:
+            columns = [list(map(html.escape, column)) for column in columns]
+            names = [html.escape(name) for name in names]
+
+        header = _TH_OPEN + _HEADER_SEP.join(names) + "</th>" if names else ""
+
+        parts: list[str] = [
+            f'<table class="anomaly-table" style="{_TABLE_STYLE}">',
+            f"<thead><tr>{header}</tr></thead><tbody>\n",
+        ]
+        append = parts.append
+        # Each row is one join over its cells with the markup between them
+        # as separator, so no per-cell string formatting is needed
+        for row in zip(*columns):
+            append(_ROW_OPEN)
+            append(_CELL_SEP.join(row))
+            append(_ROW_CLOSE)
+        append("</tbody></table>")
+
+        return "".join(parts)
+
+    @staticmethod
+    def _format_column(column: pd.Series, precision: int) -> list[str]:
+        """
+        Format all values of a column as display strings.
+
+        Args:
+            column: Column to format
+            precision: Number of decimal places for float values
+
+        Returns:
+            list[str]: Formatted values in row order
+        """
+        if pd.api.types.is_float_dtype(column):
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            formatted = np.char.mod(f"%.{precision}f", values)
+            # Nullable and pyarrow floats hold pd.NA, which Styler shows as
+            # '<NA>' rather than 'nan'
+            if not isinstance(column.dtype, np.dtype):
+                formatted[column.isna().to_numpy()] = str(pd.NA)
+            return formatted.tolist()
+
+        if pd.api.types.is_complex_dtype(column):
+            return [f"{value:.{precision}f}" for value in column.tolist()]
+
+        # Classify the column once so only columns that may hold floats need
+        # a per-value type check
+        if pd.api.types.infer_dtype(column, skipna=True) in _STR_INFERRED_TYPES:
+            return column.astype(str).tolist()
+
+        return [
+            (
+                f"{value:.{precision}f}"
+                if isinstance(value, (float, complex, np.floating, np.complexfloating))
+                else str(value)
+            )
+            for value in column.tolist()
+        ]
+
+    def _send_email(
+        self, html_body: str, anomaly_date: Optional[datetime] = None
+    ) -> None:
         """
         Send email via SMTP.
 
         Args:
             html_body: HTML content for email body
+            anomaly_date: Date used for the subject's date placeholders
 
         Raises:
             RuntimeError: If email sending fails
@@ -401,27 +606,41 @@ class EmailNotifier(Notifier, TransformableMixin):
         try:
             # Create message
             msg = MIMEMultipart("alternative")
-            msg["Subject"] = self._get_email_subject(
-                getattr(self, "_current_anomaly_date", None)
-            )
+            msg["Subject"] = self._get_email_subject(anomaly_date)
             msg["From"] = self.from_email
-            msg["To"] = ", ".join(self.to)
-
-            # Attach HTML content
-            html_part = MIMEText(html_body, "html")
-            msg.attach(html_part)
-
-            # Connect to SMTP server and send
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-
-                # Authenticate if credentials provided
-                if self.smtp_user and self.smtp_password:
-                    server.login(self.smtp_user, self.smtp_password)
-
-                # Send email
-                server.send_message(msg)
+            msg["To"] = self._to_header
+
+            images: list[MIMEImage] = []
+            if self.attach_images:
+                html_body, images = self._extract_inline_images(html_body)
+
+            # Attach HTML content, with its images when they're attachments.
+            # ASCII bodies are sent unencoded (7bit) unless a line is too
+            # long for SMTP, e.g. an inline base64 chart; base64 wraps those
+            charset = "utf-8" if _has_long_line(html_body) else None
+            html_part = MIMEText(html_body, "html", charset)
+            if images:
+                related = MIMEMultipart("related")
+                related.attach(html_part)
+                for image in images:
+                    related.attach(image)
+                msg.attach(related)
+            else:
+                msg.attach(html_part)
+
+            if self._keep_connection:
+                with self._smtp_lock:
+                    server = self._get_smtp_connection()
+                    try:
+                        server.send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        self._smtp_conn = None
+                        raise
+            else:
+                # Connect to SMTP server and send
+                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+                    self._start_smtp_session(server)
+                    server.send_message(msg)
 
         except smtplib.SMTPAuthenticationError as e:
             raise RuntimeError(
@@ -431,3 +650,108 @@ class EmailNotifier(Notifier, TransformableMixin):
             raise RuntimeError(f"Failed to send email via SMTP: {str(e)}") from e
         except Exception as e:
             raise RuntimeError(f"Unexpected error while sending email: {str(e)}") from e
+
+    @staticmethod
+    def _extract_inline_images(html_body: str) -> tuple[str, list[MIMEImage]]:
+        """
+        Move base64 data URI images out of the HTML into MIME image parts.
+
+        Each data URI is replaced with a cid: reference to an inline image
+        part. Identical images (e.g. the same chart in several rows) share
+        one part.
+
+        Args:
+            html_body: HTML content for email body
+
+        Returns:
+            tuple: HTML with cid: references and the image parts to attach
+        """
+        images: dict[str, MIMEImage] = {}
+
+        def to_cid(match: re.Match) -> str:
+            subtype, data = match.groups()
+            image = images.get(data)
+            if image is None:
+                name = f"image{len(images) + 1}"
+                image = MIMEImage(base64.b64decode(data), _subtype=subtype)
+                image.add_header("Content-ID", f"<{name}>")
+                image.add_header(
+                    "Content-Disposition", "inline", filename=f"{name}.{subtype}"
+                )
+                images[data] = image
+            return f"cid:{image['Content-ID'][1:-1]}"
+
+        html_body = _DATA_URI_IMAGE_RE.sub(to_cid, html_body)
+        return html_body, list(images.values())
+
+    def _start_smtp_session(self, server: smtplib.SMTP) -> None:
+        """
+        Upgrade the connection to TLS and authenticate if configured.
+
+        Args:
+            server: Connected SMTP client
+        """
+        if self.use_tls:
+            server.starttls()
+
+        # Authenticate if credentials provided
+        if self.smtp_user and self.smtp_password:
+            server.login(self.smtp_user, self.smtp_password)
+
+    def _get_smtp_connection(self) -> smtplib.SMTP:
+        """
+        Get the persistent SMTP connection, reconnecting if it was dropped.
+
+        A cached connection is checked with NOOP before reuse, since servers
+        close idle sessions.
+
+        Returns:
+            smtplib.SMTP: Authenticated SMTP client
+        """
+        if self._smtp_conn is not None:
+            try:
+                if self._smtp_conn.noop()[0] == 250:
+                    return self._smtp_conn
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            self._smtp_conn.close()
+            self._smtp_conn = None
+
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            self._start_smtp_session(server)
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp_conn = server
+        return server
+
+    def close(self) -> None:
+        """
+        Close the persistent SMTP connection if one is open.
+
+        This should be called when done sending, especially in long-running
+        applications to prevent resource leaks. Notifications queued by
+        notify_async() are sent before the connection is closed.
+        """
+        self.flush()
+        self._keep_connection = False
+        with self._smtp_lock:
+            if self._smtp_conn is not None:
+                try:
+                    self._smtp_conn.quit()
+                except (smtplib.SMTPException, OSError):
+                    self._smtp_conn.close()
+                finally:
+                    self._smtp_conn = None
+
+    def __enter__(self):
+        """Keep one SMTP session open for notifications sent in the block."""
+        self._keep_connection = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Ensure the SMTP connection is closed when used as context manager."""
+        self.close()
+        return False
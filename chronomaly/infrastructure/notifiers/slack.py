@@ -12,6 +12,10 @@ from slack_sdk.errors import SlackApiError
 from .base import Notifier
 from chronomaly.shared import TransformableMixin
 
+# Slack channel IDs start with 'C', user IDs with 'U' or 'W'
+_CHANNEL_ID_RE = re.compile(r"C[A-Z0-9]+")
+_USER_ID_RE = re.compile(r"[UW][A-Z0-9]+")
+
 
 class SlackNotifier(Notifier, TransformableMixin):
     """
@@ -102,9 +106,9 @@ class SlackNotifier(Notifier, TransformableMixin):
         Raises:
             ValueError: If recipient is not a valid Slack ID format
         """
-        if re.match(r"^C[A-Z0-9]+$", recipient):
+        if _CHANNEL_ID_RE.fullmatch(recipient):
             return  # Valid channel ID
-        elif re.match(r"^[UW][A-Z0-9]+$", recipient):
+        elif _USER_ID_RE.fullmatch(recipient):
             return  # Valid user ID
         else:
             raise ValueError(
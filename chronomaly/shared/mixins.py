@@ -3,6 +3,7 @@ Shared mixins for common functionality.
 """
 
 import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
 
 
 class TransformableMixin:
@@ -12,6 +13,14 @@ class TransformableMixin:
     Components that need to apply transformers should inherit from this mixin
     and set self.transformers in their __init__ method.
 
+    Assigning self.transformers resolves each transformer to the callable that
+    will be invoked (.filter(), .format() or the transformer itself) once, so
+    _apply_transformers() does not repeat that lookup on every call. Lists
+    that are changed in place (e.g. transformers["after"].append(fn)) are
+    detected and resolved again on their next use, but reassigning
+    self.transformers is preferred: it validates the new transformers
+    immediately.
+
     Usage:
         class MyComponent(TransformableMixin):
             def __init__(self, transformers=None):
@@ -22,6 +31,66 @@ class TransformableMixin:
                 return df
     """
 
+    @property
+    def transformers(self) -> Dict[str, List[Any]]:
+        """Transformer lists keyed by stage name ('before' or 'after')."""
+        return self._transformers
+
+    @transformers.setter
+    def transformers(self, value: Optional[Dict[str, List[Any]]]) -> None:
+        self._transformers = value
+        # Each stage keeps the transformers it was resolved from, so lists
+        # mutated after assignment can be told apart and resolved again
+        self._transformer_fns: dict[str, tuple[tuple, list[Callable]]] = {
+            stage: self._resolve_stage(stage_transformers)
+            for stage, stage_transformers in (value or {}).items()
+        }
+
+    @classmethod
+    def _resolve_stage(cls, transformers: List[Any]) -> tuple[tuple, list[Callable]]:
+        """
+        Resolve the transformers of one stage.
+
+        Args:
+            transformers: Transformers of the stage, in order
+
+        Returns:
+            tuple: The transformers as a tuple and their resolved callables
+        """
+        stage_transformers = tuple(transformers)
+        return stage_transformers, [
+            cls._resolve_transformer(t) for t in stage_transformers
+        ]
+
+    @staticmethod
+    def _resolve_transformer(transformer: Any) -> Callable:
+        """
+        Resolve a transformer to the callable that applies it.
+
+        Args:
+            transformer: Filter, formatter or callable transformer
+
+        Returns:
+            Callable: Function taking and returning a DataFrame
+
+        Raises:
+            TypeError: If transformer doesn't have proper interface
+        """
+        # Support .filter() method (for filters)
+        if hasattr(transformer, "filter"):
+            return transformer.filter
+        # Support .format() method (for formatters)
+        if hasattr(transformer, "format"):
+            return transformer.format
+        # Support callable objects (for any transformer)
+        if callable(transformer):
+            return transformer
+
+        raise TypeError(
+            f"Transformer must have .filter(), .format() method or "
+            f"be callable. Got: {type(transformer).__name__}"
+        )
+
     def _apply_transformers(self, df: pd.DataFrame, stage: str) -> pd.DataFrame:
         """
         Apply transformers for a specific stage.
@@ -32,31 +101,19 @@ class TransformableMixin:
 
         Returns:
             pd.DataFrame: Transformed DataFrame
-
-        Raises:
-            TypeError: If transformer doesn't have proper interface
         """
-        if not hasattr(self, "transformers"):
+        stage_transformers = (getattr(self, "_transformers", None) or {}).get(stage)
+        if not stage_transformers:
             return df
 
-        if stage not in self.transformers:
-            return df
+        resolved = self._transformer_fns.get(stage)
+        if resolved is None or resolved[0] != tuple(stage_transformers):
+            resolved = self._transformer_fns[stage] = self._resolve_stage(
+                stage_transformers
+            )
 
         result = df
-        for transformer in self.transformers[stage]:
-            # Support .filter() method (for filters)
-            if hasattr(transformer, "filter"):
-                result = transformer.filter(result)
-            # Support .format() method (for formatters)
-            elif hasattr(transformer, "format"):
-                result = transformer.format(result)
-            # Support callable objects (for any transformer)
-            elif callable(transformer):
-                result = transformer(result)
-            else:
-                raise TypeError(
-                    f"Transformer must have .filter(), .format() method or "
-                    f"be callable. Got: {type(transformer).__name__}"
-                )
+        for transformer_fn in resolved[1]:
+            result = transformer_fn(result)
 
         return result
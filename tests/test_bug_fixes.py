@@ -65,7 +65,7 @@ class TestBug009BigQueryErrorHandling:
         # Make job.result() raise an exception
         mock_job = MagicMock()
         mock_job.result.side_effect = Exception("Permission denied")
-        mock_client.load_table_from_dataframe.return_value = mock_job
+        mock_client.load_table_from_file.return_value = mock_job
 
         writer = BigQueryDataWriter(dataset="test_dataset", table="test_table")
 
@@ -273,7 +273,7 @@ class TestBug007BigQueryDeprecatedAPI:
         mock_client_class.return_value = mock_client
 
         mock_job = MagicMock()
-        mock_client.load_table_from_dataframe.return_value = mock_job
+        mock_client.load_table_from_file.return_value = mock_job
 
         writer = BigQueryDataWriter(
             project="test_project", dataset="test_dataset", table="test_table"
@@ -282,9 +282,9 @@ class TestBug007BigQueryDeprecatedAPI:
         df = pd.DataFrame({"a": [1, 2, 3]})
         writer.write(df)
 
-        # Verify load_table_from_dataframe was called with string table_id
+        # Verify load_table_from_file was called with string table_id
         # not with deprecated table reference object
-        call_args = mock_client.load_table_from_dataframe.call_args
+        call_args = mock_client.load_table_from_file.call_args
         table_ref_arg = call_args[0][1]  # Second positional argument
 
         # Should be a string, not a TableReference object
@@ -301,7 +301,7 @@ class TestBug007BigQueryDeprecatedAPI:
         mock_client_class.return_value = mock_client
 
         mock_job = MagicMock()
-        mock_client.load_table_from_dataframe.return_value = mock_job
+        mock_client.load_table_from_file.return_value = mock_job
 
         writer = BigQueryDataWriter(dataset="test_dataset", table="test_table")
 
@@ -309,7 +309,7 @@ class TestBug007BigQueryDeprecatedAPI:
         writer.write(df)
 
         # Verify table_id format without project
-        call_args = mock_client.load_table_from_dataframe.call_args
+        call_args = mock_client.load_table_from_file.call_args
         table_ref_arg = call_args[0][1]
 
         assert isinstance(table_ref_arg, str)
@@ -5,6 +5,7 @@ Tests for bugs #1, #5, #6, #7.
 
 import pytest
 import pandas as pd
+import pyarrow as pa
 import sqlite3
 from chronomaly.infrastructure.data.readers.files import CSVDataReader
 from chronomaly.infrastructure.data.readers.databases import SQLiteDataReader
@@ -53,6 +54,107 @@ class TestCSVDataReader:
         with pytest.raises(ValueError, match="date_column 'date' not found"):
             source.load()
 
+    def test_load_arrow_stream_yields_record_batches(self, tmp_path):
+        """Test that load_arrow_stream yields Arrow batches covering all rows"""
+        csv_file = tmp_path / "test.csv"
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=500).strftime("%Y-%m-%d"),
+                "value": range(500),
+            }
+        )
+        df.to_csv(csv_file, index=False)
+
+        source = CSVDataReader(file_path=str(csv_file), date_column="date")
+        batches = list(source.load_arrow_stream(block_size=1024))
+
+        assert len(batches) > 1
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 500
+
+    def test_load_arrow_stream_wraps_errors_in_later_blocks(self, tmp_path):
+        """Test that parse errors after the first block raise RuntimeError"""
+        csv_file = tmp_path / "test.csv"
+        values = [str(i) for i in range(500)] + ["not-a-number"]
+        csv_file.write_text("value\n" + "\n".join(values) + "\n")
+
+        source = CSVDataReader(file_path=str(csv_file))
+
+        with pytest.raises(RuntimeError, match="Failed to read CSV file"):
+            list(source.load_arrow_stream(block_size=1024))
+
+    def test_load_batches_parses_dates_and_applies_transformers(self, tmp_path):
+        """Test that load_batches parses dates and transforms each batch"""
+        csv_file = tmp_path / "test.csv"
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=500).strftime("%Y-%m-%d"),
+                "value": range(500),
+            }
+        )
+        df.to_csv(csv_file, index=False)
+
+        source = CSVDataReader(
+            file_path=str(csv_file),
+            date_column="date",
+            transformers={"after": [lambda batch: batch[batch["value"] % 2 == 0]]},
+        )
+        batches = list(source.load_batches(block_size=1024))
+
+        assert len(batches) > 1
+        result = pd.concat(batches, ignore_index=True)
+        assert pd.api.types.is_datetime64_any_dtype(result["date"])
+        assert len(result) == 250
+        assert (result["value"] % 2 == 0).all()
+
+    def test_load_batches_with_missing_date_column_raises_error(self, tmp_path):
+        """Test that load_batches raises error when date_column doesn't exist"""
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({"timestamp": ["2024-01-01"], "value": [1]}).to_csv(
+            csv_file, index=False
+        )
+
+        source = CSVDataReader(file_path=str(csv_file), date_column="date")
+
+        with pytest.raises(ValueError, match="date_column 'date' not found"):
+            list(source.load_batches())
+
+    def test_csv_iso_dates_with_missing_values(self, tmp_path):
+        """Test that ISO date strings with gaps parse to datetime with NaT"""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("date,value\n2024-01-01,1\n,2\n2024-01-03 12:30:00,3\n")
+
+        source = CSVDataReader(file_path=str(csv_file), date_column="date")
+        result = source.load()
+
+        assert pd.api.types.is_datetime64_any_dtype(result["date"])
+        assert result["date"].iloc[0] == pd.Timestamp("2024-01-01")
+        assert pd.isna(result["date"].iloc[1])
+        assert result["date"].iloc[2] == pd.Timestamp("2024-01-03 12:30:00")
+
+    def test_csv_non_iso_dates_fall_back_to_pandas(self, tmp_path):
+        """Test that non-ISO date strings are still parsed"""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("date,value\n01/02/2024,1\n01/03/2024,2\n")
+
+        source = CSVDataReader(file_path=str(csv_file), date_column="date")
+        result = source.load()
+
+        assert result["date"].tolist() == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2024-01-03"),
+        ]
+
+    def test_csv_unparseable_dates_raise_error(self, tmp_path):
+        """Test that unparseable date strings raise ValueError"""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("date,value\nnot-a-date,1\n")
+
+        source = CSVDataReader(file_path=str(csv_file), date_column="date")
+
+        with pytest.raises(ValueError, match="Failed to parse date_column"):
+            source.load()
+
 
 class TestSQLiteDataReader:
     """Tests for SQLiteDataReader"""
@@ -128,3 +230,93 @@ class TestSQLiteDataReader:
         # This should raise ValueError but currently doesn't (BUG #6)
         with pytest.raises(ValueError, match="date_column 'date' not found"):
             source.load()
+
+    def test_sqlite_reuses_connection_across_loads(self, tmp_path):
+        """Test that repeated loads share one connection until close()"""
+        db_file = tmp_path / "test.db"
+        conn = sqlite3.connect(str(db_file))
+        pd.DataFrame({"date": ["2024-01-01"], "value": [1]}).to_sql(
+            "test_table", conn, index=False
+        )
+        conn.close()
+
+        source = SQLiteDataReader(
+            database_path=str(db_file), query="SELECT * FROM test_table"
+        )
+        source.load()
+        first_conn = source._conn
+        source.load()
+
+        assert first_conn is not None
+        assert source._conn is first_conn
+
+        source.close()
+        assert source._conn is None
+
+    def test_sqlite_context_manager_closes_connection(self, tmp_path):
+        """Test that the reader closes its connection on context exit"""
+        db_file = tmp_path / "test.db"
+        conn = sqlite3.connect(str(db_file))
+        pd.DataFrame({"date": ["2024-01-01"], "value": [1]}).to_sql(
+            "test_table", conn, index=False
+        )
+        conn.close()
+
+        with SQLiteDataReader(
+            database_path=str(db_file), query="SELECT * FROM test_table"
+        ) as source:
+            result = source.load()
+            assert source._conn is not None
+
+        assert len(result) == 1
+        assert source._conn is None
+
+    def test_sqlite_dtypes_are_applied(self, tmp_path):
+        """Test that explicit dtypes are passed to read_sql_query"""
+        db_file = tmp_path / "test.db"
+        conn = sqlite3.connect(str(db_file))
+        pd.DataFrame({"date": ["2024-01-01", "2024-01-02"], "value": [1, 2]}).to_sql(
+            "test_table", conn, index=False
+        )
+        conn.close()
+
+        source = SQLiteDataReader(
+            database_path=str(db_file),
+            query="SELECT * FROM test_table",
+            dtypes={"value": "float32"},
+        )
+        result = source.load()
+
+        assert result["value"].dtype == "float32"
+
+    def test_sqlite_pyarrow_dtype_backend(self, tmp_path):
+        """Test that dtype_backend='pyarrow' yields Arrow-backed columns"""
+        db_file = tmp_path / "test.db"
+        conn = sqlite3.connect(str(db_file))
+        pd.DataFrame({"date": ["2024-01-01", "2024-01-02"], "value": [1, 2]}).to_sql(
+            "test_table", conn, index=False
+        )
+        conn.close()
+
+        source = SQLiteDataReader(
+            database_path=str(db_file),
+            query="SELECT * FROM test_table",
+            date_column="date",
+            dtype_backend="pyarrow",
+        )
+        result = source.load()
+
+        assert isinstance(result["value"].dtype, pd.ArrowDtype)
+        assert pd.api.types.is_datetime64_any_dtype(result["date"])
+
+    def test_sqlite_invalid_dtype_backend_raises_error(self, tmp_path):
+        """Test that an unknown dtype_backend is rejected at construction"""
+        db_file = tmp_path / "test.db"
+        sqlite3.connect(str(db_file)).close()
+
+        with pytest.raises(ValueError, match="Invalid dtype_backend"):
+            SQLiteDataReader(
+                database_path=str(db_file),
+                query="SELECT 1",
+                dtype_backend="arrow",
+            )
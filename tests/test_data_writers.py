@@ -0,0 +1,851 @@
+"""
+Tests for data writer implementations.
+"""
+
+import os
+import pytest
+import sqlite3
+from datetime import date, time
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from unittest.mock import MagicMock, patch
+from chronomaly.infrastructure.data.writers.databases import (
+    BigQueryDataWriter,
+    SQLiteDataWriter,
+    close_clients,
+    wait_all,
+)
+from chronomaly.infrastructure.data.writers.files import ParquetDataWriter
+
+
+@pytest.fixture
+def service_account_file(tmp_path):
+    """Create a placeholder service account JSON file"""
+    path = tmp_path / "service_account.json"
+    path.write_text("{}")
+    return str(path)
+
+
+@pytest.fixture
+def mock_bigquery_client():
+    """Patch credentials loading and the BigQuery client class"""
+    module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+    with (
+        patch(f"{module}.service_account.Credentials.from_service_account_file"),
+        patch(f"{module}.bigquery.Client") as mock_client_class,
+    ):
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        close_clients()
+        yield mock_client
+        close_clients()
+
+
+@pytest.fixture
+def mock_write_client():
+    """Patch the BigQuery Storage Write API client class"""
+    module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+    with patch(f"{module}.bigquery_storage_v1.BigQueryWriteClient") as client_class:
+        write_client = MagicMock()
+        write_client.table_path.return_value = (
+            "projects/test_project/datasets/test_dataset/tables/test_table"
+        )
+        ok_response = MagicMock()
+        ok_response.error.code = 0
+        ok_response.row_errors = []
+        write_client.append_rows.return_value = [ok_response]
+        client_class.return_value = write_client
+        yield write_client
+
+
+class TestBigQueryDataWriter:
+    """Tests for BigQueryDataWriter"""
+
+    def _make_writer(self, service_account_file, **kwargs):
+        return BigQueryDataWriter(
+            service_account_file=service_account_file,
+            project="test_project",
+            dataset="test_dataset",
+            table="test_table",
+            **kwargs,
+        )
+
+    def _uploaded_table(self, mock_client, call_index=0):
+        call_args = mock_client.load_table_from_file.call_args_list[call_index]
+        return pq.read_table(call_args[0][0])
+
+    def test_write_uploads_parquet_with_string_columns(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that all columns are uploaded as Parquet strings"""
+        writer = self._make_writer(service_account_file)
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=3).date,
+                "value": [1.5, 2.5, np.nan],
+                "count": [1, 2, 3],
+                "label": ["a", "b", "c"],
+            }
+        )
+
+        writer.write(df)
+
+        call_args = mock_bigquery_client.load_table_from_file.call_args
+        assert call_args[0][1] == "test_project.test_dataset.test_table"
+        job_config = call_args[1]["job_config"]
+        assert job_config.source_format == "PARQUET"
+
+        table = self._uploaded_table(mock_bigquery_client)
+        assert table.column_names == ["date", "value", "count", "label"]
+        assert all(str(field.type) == "string" for field in table.schema)
+        assert table.column("date").to_pylist()[0] == "2024-01-01"
+        assert table.column("value").to_pylist() == ["1.5", "2.5", None]
+        assert table.column("count").to_pylist() == ["1", "2", "3"]
+
+    def test_write_keeps_astype_str_text(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that present values are written as astype(str) renders them"""
+        writer = self._make_writer(service_account_file)
+        df = pd.DataFrame(
+            {
+                "day": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "timestamp": pd.to_datetime(
+                    ["2024-01-01 12:30:00", "2024-01-02 00:00:00"]
+                ),
+                "value": [1.0, 2.5],
+                "flag": [True, False],
+                "count": [1, 2],
+                "label": ["a", "b"],
+            }
+        )
+
+        writer.write(df)
+
+        table = self._uploaded_table(mock_bigquery_client)
+        assert table.to_pydict() == df.astype(str).to_dict(orient="list")
+
+    @pytest.mark.parametrize(
+        "create_disposition, write_disposition",
+        [
+            ("CREATE_IF_NEEDED", "WRITE_TRUNCATE"),
+            ("CREATE_NEVER", "WRITE_APPEND"),
+            ("CREATE_IF_NEEDED", "WRITE_EMPTY"),
+        ],
+    )
+    def test_write_sets_dispositions(
+        self,
+        service_account_file,
+        mock_bigquery_client,
+        create_disposition,
+        write_disposition,
+    ):
+        """Test that disposition names are mapped onto the load job config"""
+        writer = self._make_writer(
+            service_account_file,
+            create_disposition=create_disposition,
+            write_disposition=write_disposition,
+        )
+
+        writer.write(pd.DataFrame({"value": [1]}))
+
+        job_config = mock_bigquery_client.load_table_from_file.call_args[1][
+            "job_config"
+        ]
+        assert job_config.create_disposition == create_disposition
+        assert job_config.write_disposition == write_disposition
+
+    def test_missing_service_account_file_raises_error(self, tmp_path):
+        """Test that the service account path must be an existing file"""
+        with pytest.raises(FileNotFoundError, match="not found"):
+            self._make_writer(str(tmp_path / "missing.json"))
+        with pytest.raises(FileNotFoundError, match="not found"):
+            self._make_writer(str(tmp_path))
+
+        not_a_dir = tmp_path / "not_a_dir"
+        not_a_dir.write_text("")
+        with pytest.raises(FileNotFoundError, match="not found"):
+            self._make_writer(str(not_a_dir / "key.json"))
+
+    def test_non_json_service_account_file_raises_error(self, tmp_path):
+        """Test that the service account file must have a .json extension"""
+        path = tmp_path / "service_account.txt"
+        path.write_text("{}")
+
+        with pytest.raises(ValueError, match="must be a JSON file"):
+            self._make_writer(str(path))
+
+    def test_invalid_disposition_raises_error(self, service_account_file):
+        """Test that unknown dispositions are rejected at construction"""
+        with pytest.raises(ValueError, match="Invalid write_disposition"):
+            self._make_writer(service_account_file, write_disposition="WRITE_ALL")
+
+    def test_write_uploads_zstd_dictionary_encoded_parquet(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that uploads use ZSTD compression and dictionary encoding"""
+        writer = self._make_writer(service_account_file)
+
+        writer.write(pd.DataFrame({"metric": ["sessions"] * 100}))
+
+        call_args = mock_bigquery_client.load_table_from_file.call_args
+        call_args[0][0].seek(0)
+        column = pq.ParquetFile(call_args[0][0]).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+        assert "RLE_DICTIONARY" in column.encodings
+
+    def test_write_empty_dataframe_keeps_string_schema(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that empty DataFrames still produce string columns"""
+        writer = self._make_writer(service_account_file)
+
+        writer.write(pd.DataFrame({"date": [], "value": []}))
+
+        table = self._uploaded_table(mock_bigquery_client)
+        assert table.num_rows == 0
+        assert all(str(field.type) == "string" for field in table.schema)
+
+    def test_write_mixed_object_column(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that object columns mixing Python types are stringified"""
+        writer = self._make_writer(service_account_file)
+
+        writer.write(pd.DataFrame({"mixed": [1, "a", 2.5]}))
+
+        table = self._uploaded_table(mock_bigquery_client)
+        assert table.column("mixed").to_pylist() == ["1", "a", "2.5"]
+
+    def test_job_failure_raises_runtime_error(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that load job failures are wrapped with table context"""
+        mock_job = MagicMock()
+        mock_job.result.side_effect = Exception("Permission denied")
+        mock_bigquery_client.load_table_from_file.return_value = mock_job
+        writer = self._make_writer(service_account_file)
+
+        with pytest.raises(RuntimeError, match="test_dataset.test_table"):
+            writer.write(pd.DataFrame({"a": [1]}))
+
+    def test_write_uses_single_load_job_by_default(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that without chunk_rows the frame is loaded in one job"""
+        writer = self._make_writer(service_account_file)
+
+        writer.write(pd.DataFrame({"value": range(10)}))
+
+        assert mock_bigquery_client.load_table_from_file.call_count == 1
+        assert self._uploaded_table(mock_bigquery_client).num_rows == 10
+
+    def test_write_splits_into_chunks(self, service_account_file, mock_bigquery_client):
+        """Test that large frames are uploaded in chunk_rows-sized load jobs"""
+        writer = self._make_writer(
+            service_account_file,
+            create_disposition="CREATE_IF_NEEDED",
+            write_disposition="WRITE_TRUNCATE",
+            chunk_rows=4,
+        )
+
+        writer.write(pd.DataFrame({"value": range(10)}))
+
+        calls = mock_bigquery_client.load_table_from_file.call_args_list
+        assert len(calls) == 3
+        assert [
+            self._uploaded_table(mock_bigquery_client, i).num_rows for i in range(3)
+        ] == [4, 4, 2]
+
+        first_config = calls[0][1]["job_config"]
+        assert first_config.create_disposition == "CREATE_IF_NEEDED"
+        assert first_config.write_disposition == "WRITE_TRUNCATE"
+        for call in calls[1:]:
+            assert call[1]["job_config"].create_disposition == "CREATE_NEVER"
+            assert call[1]["job_config"].write_disposition == "WRITE_APPEND"
+
+    def test_first_chunk_completes_before_appends(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that appended chunks are not submitted if the first one fails"""
+        mock_job = MagicMock()
+        mock_job.result.side_effect = Exception("Table creation failed")
+        mock_bigquery_client.load_table_from_file.return_value = mock_job
+        writer = self._make_writer(service_account_file, chunk_rows=2)
+
+        with pytest.raises(RuntimeError, match="Table creation failed"):
+            writer.write(pd.DataFrame({"value": range(6)}))
+
+        assert mock_bigquery_client.load_table_from_file.call_count == 1
+
+    @pytest.mark.parametrize("chunk_rows", [0, -1, 1.5])
+    def test_invalid_chunk_rows_raises_error(self, service_account_file, chunk_rows):
+        """Test that chunk_rows must be a positive integer"""
+        with pytest.raises(ValueError, match="chunk_rows must be a positive integer"):
+            self._make_writer(service_account_file, chunk_rows=chunk_rows)
+
+    def test_storage_write_api_streams_arrow_batches(
+        self, service_account_file, mock_bigquery_client, mock_write_client
+    ):
+        """Test that rows are appended to the default stream as Arrow batches"""
+        writer = self._make_writer(
+            service_account_file,
+            write_disposition="WRITE_TRUNCATE",
+            use_storage_write_api=True,
+        )
+        writer.STORAGE_WRITE_REQUEST_BYTES = 64
+
+        writer.write(pd.DataFrame({"date": ["2024-01-01"] * 20, "value": range(20)}))
+
+        mock_bigquery_client.load_table_from_file.assert_not_called()
+        created_table = mock_bigquery_client.create_table.call_args[0][0]
+        assert [field.field_type for field in created_table.schema] == [
+            "STRING",
+            "STRING",
+        ]
+        mock_bigquery_client.query.assert_called_once_with(
+            "TRUNCATE TABLE `test_project.test_dataset.test_table`"
+        )
+
+        call = mock_write_client.append_rows.call_args
+        requests = list(call[0][0])
+        stream_name = (
+            "projects/test_project/datasets/test_dataset/tables/test_table"
+            "/streams/_default"
+        )
+        assert ("x-goog-request-params", f"write_stream={stream_name}") in call[1][
+            "metadata"
+        ]
+        assert len(requests) > 1
+        assert all(request.write_stream == stream_name for request in requests)
+
+        schema = pa.ipc.read_schema(
+            pa.py_buffer(requests[0].arrow_rows.writer_schema.serialized_schema)
+        )
+        values = []
+        for request in requests:
+            batch = pa.ipc.read_record_batch(
+                pa.py_buffer(request.arrow_rows.rows.serialized_record_batch), schema
+            )
+            values.extend(batch.column("value").to_pylist())
+        assert values == [str(i) for i in range(20)]
+
+    def test_storage_write_api_write_empty_rejects_non_empty_table(
+        self, service_account_file, mock_bigquery_client, mock_write_client
+    ):
+        """Test that WRITE_EMPTY refuses to stream into a non-empty table"""
+        mock_bigquery_client.get_table.return_value.num_rows = 5
+        writer = self._make_writer(
+            service_account_file,
+            write_disposition="WRITE_EMPTY",
+            use_storage_write_api=True,
+        )
+
+        with pytest.raises(RuntimeError, match="not empty"):
+            writer.write(pd.DataFrame({"value": [1]}))
+
+        mock_write_client.append_rows.assert_not_called()
+
+    def test_storage_write_api_append_error_raises_runtime_error(
+        self, service_account_file, mock_bigquery_client, mock_write_client
+    ):
+        """Test that append errors reported by the API are raised"""
+        error_response = MagicMock()
+        error_response.error.code = 3
+        error_response.error.message = "Invalid schema"
+        mock_write_client.append_rows.return_value = [error_response]
+        writer = self._make_writer(
+            service_account_file,
+            create_disposition="CREATE_NEVER",
+            write_disposition="WRITE_APPEND",
+            use_storage_write_api=True,
+        )
+
+        with pytest.raises(RuntimeError, match="Invalid schema"):
+            writer.write(pd.DataFrame({"value": [1]}))
+
+        mock_bigquery_client.create_table.assert_not_called()
+        mock_bigquery_client.query.assert_not_called()
+
+    def test_job_polling_backs_off_exponentially(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that load jobs are polled with a short timeout and backoff"""
+        mock_job = MagicMock()
+        mock_job.done.side_effect = [False, False, False, True]
+        mock_bigquery_client.load_table_from_file.return_value = mock_job
+        writer = self._make_writer(service_account_file)
+
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        with patch(f"{module}.time.sleep") as mock_sleep:
+            writer.write(pd.DataFrame({"a": [1]}))
+
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [1.0, 1.5, 2.25]
+        for call in mock_job.done.call_args_list:
+            assert call[1]["timeout"] == writer.JOB_POLL_TIMEOUT
+        mock_job.result.assert_called_once()
+
+    def test_write_without_await_returns_pending_jobs(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that await_completion=False returns jobs without waiting"""
+        mock_job = MagicMock()
+        mock_bigquery_client.load_table_from_file.return_value = mock_job
+        writer = self._make_writer(service_account_file)
+
+        jobs = writer.write(pd.DataFrame({"a": [1]}), await_completion=False)
+
+        assert jobs == [mock_job]
+        mock_job.done.assert_not_called()
+        mock_job.result.assert_not_called()
+
+    def test_write_without_await_waits_for_first_chunk_only(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that the first chunk is awaited before appends are returned"""
+        first_job, second_job = MagicMock(), MagicMock()
+        mock_bigquery_client.load_table_from_file.side_effect = [first_job, second_job]
+        writer = self._make_writer(service_account_file, chunk_rows=2)
+
+        jobs = writer.write(pd.DataFrame({"a": [1, 2, 3]}), await_completion=False)
+
+        assert jobs == [second_job]
+        first_job.result.assert_called_once()
+        second_job.result.assert_not_called()
+
+    def test_wait_all_waits_for_every_job(self):
+        """Test that wait_all polls each job until done"""
+        first_job, second_job = MagicMock(), MagicMock()
+        second_job.done.side_effect = [False, True]
+
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        with patch(f"{module}.time.sleep") as mock_sleep:
+            wait_all([first_job, second_job])
+
+        first_job.result.assert_called_once()
+        second_job.result.assert_called_once()
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_wait_all_raises_runtime_error_on_failed_job(self):
+        """Test that a failed job is reported as RuntimeError"""
+        failed_job = MagicMock(job_id="job_1")
+        failed_job.result.side_effect = Exception("Load failed")
+
+        with pytest.raises(RuntimeError, match="job_1 failed. Error: Load failed"):
+            wait_all([failed_job])
+
+    def test_wait_all_times_out(self):
+        """Test that wait_all gives up once the timeout has passed"""
+        pending_job = MagicMock(job_id="job_1")
+        pending_job.done.return_value = False
+
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        with patch(f"{module}.time.sleep"):
+            with pytest.raises(TimeoutError, match="job_1"):
+                wait_all([pending_job], timeout=0)
+
+        pending_job.result.assert_not_called()
+
+    def test_client_shared_across_writers(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that writers with the same credentials share one client"""
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        first = self._make_writer(service_account_file)
+        second = BigQueryDataWriter(
+            service_account_file=service_account_file,
+            project="test_project",
+            dataset="other_dataset",
+            table="other_table",
+        )
+
+        with patch(f"{module}.bigquery.Client") as mock_client_class:
+            mock_client_class.side_effect = [MagicMock(), MagicMock()]
+            assert first._get_client() is second._get_client()
+            other_project = BigQueryDataWriter(
+                service_account_file=service_account_file,
+                project="other_project",
+                dataset="test_dataset",
+                table="test_table",
+            )
+            assert other_project._get_client() is not first._get_client()
+
+        assert mock_client_class.call_count == 2
+
+    def test_credentials_parsed_once_per_file_version(
+        self, service_account_file, mock_bigquery_client, mock_write_client
+    ):
+        """Test that credentials are cached until the key file changes"""
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        writer = self._make_writer(service_account_file)
+
+        with patch(
+            f"{module}.service_account.Credentials.from_service_account_file"
+        ) as mock_from_file:
+            writer._get_client()
+            writer._get_write_client()
+            self._make_writer(service_account_file)._get_write_client()
+            assert mock_from_file.call_count == 1
+
+            stat_result = os.stat(service_account_file)
+            os.utime(
+                service_account_file,
+                ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9),
+            )
+            self._make_writer(service_account_file)._get_write_client()
+            assert mock_from_file.call_count == 2
+
+    def test_rotated_key_file_gets_new_client(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that a changed key file mtime builds a client with new credentials"""
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        writer = self._make_writer(service_account_file)
+
+        with patch(f"{module}.bigquery.Client") as mock_client_class:
+            first_client, second_client = MagicMock(), MagicMock()
+            mock_client_class.side_effect = [first_client, second_client]
+
+            assert writer._get_client() is first_client
+            assert writer._get_client() is first_client
+
+            stat_result = os.stat(service_account_file)
+            os.utime(
+                service_account_file,
+                ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9),
+            )
+
+            assert writer._get_client() is second_client
+            assert mock_client_class.call_count == 2
+
+    def test_close_clients_closes_and_resets_cache(
+        self, service_account_file, mock_bigquery_client
+    ):
+        """Test that close_clients closes shared clients and drops them"""
+        module = "chronomaly.infrastructure.data.writers.databases.bigquery"
+        writer = self._make_writer(service_account_file)
+
+        with patch(f"{module}.bigquery.Client") as mock_client_class:
+            first_client, second_client = MagicMock(), MagicMock()
+            mock_client_class.side_effect = [first_client, second_client]
+
+            assert writer._get_client() is first_client
+            close_clients()
+            first_client.close.assert_called_once()
+            assert writer._get_client() is second_client
+
+
+class TestSQLiteDataWriter:
+    """Tests for SQLiteDataWriter"""
+
+    def _read_rows(self, db_file, table="forecast"):
+        conn = sqlite3.connect(str(db_file))
+        try:
+            return conn.execute(f"SELECT * FROM {table}").fetchall()
+        finally:
+            conn.close()
+
+    def test_write_matches_pandas_to_sql(self, tmp_path):
+        """Test that stored values and column types match pandas.to_sql()"""
+        db_file = tmp_path / "test.db"
+        df = pd.DataFrame(
+            {
+                "date": [date(2024, 1, 1), None],
+                "timestamp": pd.to_datetime(["2024-01-01 12:30:00", None]),
+                "value": [1.5, np.nan],
+                "count": [1, 2],
+                "flag": [True, False],
+                "label": ["a", None],
+            }
+        )
+
+        SQLiteDataWriter(database_path=str(db_file), table_name="forecast").write(df)
+
+        conn = sqlite3.connect(str(db_file))
+        df.to_sql("expected", conn, index=False)
+        expected_rows = conn.execute("SELECT * FROM expected").fetchall()
+        column_types = [
+            row[2] for row in conn.execute("PRAGMA table_info(forecast)").fetchall()
+        ]
+        expected_types = [
+            row[2] for row in conn.execute("PRAGMA table_info(expected)").fetchall()
+        ]
+        conn.close()
+
+        assert self._read_rows(db_file) == expected_rows
+        assert column_types == expected_types
+
+    def test_write_timedeltas_and_times_like_to_sql(self, tmp_path):
+        """Test that timedeltas and times are stored as pandas.to_sql() does"""
+        db_file = tmp_path / "test.db"
+        df = pd.DataFrame(
+            {
+                "duration": pd.to_timedelta(["1s", "2h"]),
+                "time": [time(1, 2), time(1, 2, 3, 45)],
+            }
+        )
+
+        SQLiteDataWriter(database_path=str(db_file), table_name="forecast").write(df)
+
+        conn = sqlite3.connect(str(db_file))
+        df.to_sql("expected", conn, index=False)
+        expected_rows = conn.execute("SELECT * FROM expected").fetchall()
+        conn.close()
+
+        assert self._read_rows(db_file) == expected_rows
+
+    def test_write_missing_timedelta_as_null(self, tmp_path):
+        """Test that NaT timedeltas are stored as NULL"""
+        db_file = tmp_path / "test.db"
+        df = pd.DataFrame({"duration": pd.to_timedelta(["1s", None])})
+
+        SQLiteDataWriter(database_path=str(db_file), table_name="forecast").write(df)
+
+        assert self._read_rows(db_file) == [(1_000_000_000,), (None,)]
+
+    def test_concurrent_writes_share_connection_safely(self, tmp_path):
+        """Test that threads writing through one writer don't collide"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        db_file = tmp_path / "test.db"
+        writer = SQLiteDataWriter(str(db_file), "forecast", if_exists="append")
+        writer.write(pd.DataFrame({"value": [0]}))
+
+        def write_rows(_):
+            for _ in range(5):
+                writer.write(pd.DataFrame({"value": range(1000)}))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(write_rows, range(4)))
+        writer.close()
+
+        assert len(self._read_rows(db_file)) == 1 + 4 * 5 * 1000
+
+    def test_write_keeps_error_when_sqlite_already_rolled_back(self, tmp_path):
+        """Test that no ROLLBACK is issued once SQLite ended the transaction"""
+        writer = SQLiteDataWriter(
+            str(tmp_path / "test.db"), "forecast", if_exists="append"
+        )
+        conn = MagicMock(in_transaction=False)
+        conn.executemany.side_effect = sqlite3.OperationalError("disk is full")
+        writer._conn = conn
+
+        with pytest.raises(RuntimeError, match="disk is full"):
+            writer.write(pd.DataFrame({"value": [1]}))
+
+        assert ("ROLLBACK",) not in [c.args for c in conn.execute.call_args_list]
+
+    def test_if_exists_replace_and_append(self, tmp_path):
+        """Test that replace recreates the table and append adds rows"""
+        db_file = tmp_path / "test.db"
+        df = pd.DataFrame({"value": [1, 2]})
+
+        SQLiteDataWriter(str(db_file), "forecast").write(df)
+        SQLiteDataWriter(str(db_file), "forecast").write(df)
+        assert len(self._read_rows(db_file)) == 2
+
+        SQLiteDataWriter(str(db_file), "forecast", if_exists="append").write(df)
+        assert len(self._read_rows(db_file)) == 4
+
+    def test_append_matches_columns_by_name(self, tmp_path):
+        """Test that appended rows are matched to columns by name"""
+        db_file = tmp_path / "test.db"
+        SQLiteDataWriter(str(db_file), "forecast").write(
+            pd.DataFrame({"a": [1], "b": [2]})
+        )
+
+        SQLiteDataWriter(str(db_file), "forecast", if_exists="append").write(
+            pd.DataFrame({"b": [4], "a": [3]})
+        )
+
+        assert self._read_rows(db_file) == [(1, 2), (3, 4)]
+
+    def test_if_exists_fail_raises_error(self, tmp_path):
+        """Test that if_exists='fail' refuses to touch an existing table"""
+        db_file = tmp_path / "test.db"
+        df = pd.DataFrame({"value": [1]})
+        SQLiteDataWriter(str(db_file), "forecast").write(df)
+
+        writer = SQLiteDataWriter(str(db_file), "forecast", if_exists="fail")
+
+        with pytest.raises(RuntimeError, match="already exists"):
+            writer.write(df)
+
+    def test_failed_write_rolls_back(self, tmp_path):
+        """Test that a failing replace leaves the previous table intact"""
+        db_file = tmp_path / "test.db"
+        SQLiteDataWriter(str(db_file), "forecast").write(pd.DataFrame({"value": [1]}))
+
+        bad_df = pd.DataFrame({"value": [object()]})
+
+        with pytest.raises(RuntimeError):
+            SQLiteDataWriter(str(db_file), "forecast").write(bad_df)
+
+        assert self._read_rows(db_file) == [(1,)]
+
+    def test_chunksize_batches_inserts(self, tmp_path):
+        """Test that rows are inserted in chunksize batches"""
+        db_file = tmp_path / "test.db"
+        writer = SQLiteDataWriter(str(db_file), "forecast", chunksize=3)
+
+        writer.write(pd.DataFrame({"value": range(10)}))
+
+        assert [row[0] for row in self._read_rows(db_file)] == list(range(10))
+
+    def test_dtype_overrides_column_types(self, tmp_path):
+        """Test that dtype overrides the created column types"""
+        db_file = tmp_path / "test.db"
+        writer = SQLiteDataWriter(str(db_file), "forecast", dtype={"value": "TEXT"})
+
+        writer.write(pd.DataFrame({"value": [1]}))
+
+        conn = sqlite3.connect(str(db_file))
+        column_type = conn.execute("PRAGMA table_info(forecast)").fetchone()[2]
+        conn.close()
+        assert column_type == "TEXT"
+
+    def test_connection_reused_across_writes_in_wal_mode(self, tmp_path):
+        """Test that one WAL-mode connection serves repeated writes"""
+        db_file = tmp_path / "test.db"
+        writer = SQLiteDataWriter(str(db_file), "forecast", if_exists="append")
+
+        writer.write(pd.DataFrame({"value": [1]}))
+        conn = writer._conn
+        writer.write(pd.DataFrame({"value": [2]}))
+
+        assert writer._conn is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert self._read_rows(db_file) == [(1,), (2,)]
+        writer.close()
+
+    def test_new_database_uses_large_pages_and_mmap(self, tmp_path):
+        """Test that new databases get 32 KiB pages and memory-mapped I/O"""
+        db_file = tmp_path / "test.db"
+
+        with SQLiteDataWriter(str(db_file), "forecast") as writer:
+            writer.write(pd.DataFrame({"value": [1]}))
+            assert writer._conn.execute("PRAGMA mmap_size").fetchone()[0] > 0
+
+        conn = sqlite3.connect(str(db_file))
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        conn.close()
+        assert page_size == 32768
+
+    def test_context_manager_closes_connection(self, tmp_path):
+        """Test that leaving the context closes the connection"""
+        db_file = tmp_path / "test.db"
+
+        with SQLiteDataWriter(str(db_file), "forecast") as writer:
+            writer.write(pd.DataFrame({"value": [1]}))
+            assert writer._conn is not None
+
+        assert writer._conn is None
+        assert self._read_rows(db_file) == [(1,)]
+
+    def test_parent_path_must_be_directory(self, tmp_path):
+        """Test that database_path must live in an existing directory"""
+        parent_file = tmp_path / "not_a_dir"
+        parent_file.write_text("")
+
+        with pytest.raises(FileNotFoundError, match="Parent directory"):
+            SQLiteDataWriter(str(tmp_path / "missing" / "test.db"), "forecast")
+        with pytest.raises(FileNotFoundError, match="Parent directory"):
+            SQLiteDataWriter(str(parent_file / "test.db"), "forecast")
+        with pytest.raises(FileNotFoundError, match="Parent directory"):
+            SQLiteDataWriter(str(parent_file / "sub" / "test.db"), "forecast")
+
+    def test_other_to_sql_options_are_deprecated(self, tmp_path):
+        """Test that other to_sql() options warn and are passed to to_sql()"""
+        db_file = tmp_path / "test.db"
+        inserted = []
+
+        def insert(table, conn, keys, data_iter):
+            rows = list(data_iter)
+            inserted.extend(rows)
+            conn.executemany(f"INSERT INTO {table.name} VALUES (?)", rows)
+
+        with pytest.warns(DeprecationWarning, match="method"):
+            writer = SQLiteDataWriter(str(db_file), "forecast", method=insert)
+
+        writer.write(pd.DataFrame({"value": [1, 2]}))
+        writer.close()
+
+        assert inserted == [(1,), (2,)]
+        assert self._read_rows(db_file) == [(1,), (2,)]
+
+    def test_invalid_chunksize_raises_error(self, tmp_path):
+        """Test that chunksize must be a positive integer"""
+        with pytest.raises(ValueError, match="chunksize must be a positive integer"):
+            SQLiteDataWriter(str(tmp_path / "test.db"), "forecast", chunksize=0)
+
+    @pytest.mark.parametrize("table_name", ["forecast\n", "fore-cast", "a b"])
+    def test_invalid_table_name_raises_error(self, tmp_path, table_name):
+        """Test that table names must consist entirely of word characters"""
+        with pytest.raises(ValueError, match="Invalid table_name"):
+            SQLiteDataWriter(str(tmp_path / "test.db"), table_name)
+
+    def test_keyword_table_name_raises_error(self, tmp_path):
+        """Test that SQL keywords are rejected as table names"""
+        with pytest.raises(ValueError, match="SQL keyword"):
+            SQLiteDataWriter(str(tmp_path / "test.db"), "Drop")
+
+
+class TestParquetDataWriter:
+    """Tests for ParquetDataWriter"""
+
+    def test_write_round_trips_dataframe(self, tmp_path):
+        """Test that written data and dtypes are read back unchanged"""
+        file_path = tmp_path / "forecast.parquet"
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=3),
+                "value": [1.5, 2.5, np.nan],
+                "label": ["a", "b", None],
+            }
+        )
+
+        ParquetDataWriter(str(file_path)).write(df)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+        metadata = pq.ParquetFile(file_path).metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_before_transformers_applied(self, tmp_path):
+        """Test that 'before' transformers run prior to writing"""
+        file_path = tmp_path / "forecast.parquet"
+        writer = ParquetDataWriter(
+            str(file_path), transformers={"before": [lambda d: d[d["value"] > 1]]}
+        )
+
+        writer.write(pd.DataFrame({"value": [1, 2, 3]}))
+
+        assert pd.read_parquet(file_path)["value"].tolist() == [2, 3]
+
+    def test_if_exists_fail_raises_error(self, tmp_path):
+        """Test that an existing file is kept when if_exists='fail'"""
+        file_path = tmp_path / "forecast.parquet"
+        file_path.write_bytes(b"existing")
+        writer = ParquetDataWriter(str(file_path), if_exists="fail")
+
+        with pytest.raises(ValueError, match="already exists"):
+            writer.write(pd.DataFrame({"value": [1]}))
+        assert file_path.read_bytes() == b"existing"
+
+    def test_empty_dataframe_raises_error(self, tmp_path):
+        """Test that empty DataFrames are rejected"""
+        writer = ParquetDataWriter(str(tmp_path / "forecast.parquet"))
+
+        with pytest.raises(ValueError, match="empty"):
+            writer.write(pd.DataFrame())
+
+    def test_missing_parent_directory_raises_error(self, tmp_path):
+        """Test that the parent directory must exist"""
+        with pytest.raises(FileNotFoundError, match="Parent directory"):
+            ParquetDataWriter(str(tmp_path / "missing" / "forecast.parquet"))
+
+    def test_invalid_compression_raises_error(self, tmp_path):
+        """Test that unknown compression codecs are rejected"""
+        with pytest.raises(ValueError, match="Invalid compression"):
+            ParquetDataWriter(str(tmp_path / "forecast.parquet"), compression="xz")
@@ -4,8 +4,24 @@ Tests for bug #2.
 """
 
 import pytest
+from datetime import date
 import pandas as pd
 import numpy as np
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Keep models cached by one test from leaking into the next"""
+    try:
+        from chronomaly.infrastructure.forecasters import TimesFMForecaster
+    except ImportError:
+        yield
+        return
+
+    TimesFMForecaster.clear_model_cache()
+    yield
+    TimesFMForecaster.clear_model_cache()
 
 
 class TestTimesFMForecaster:
@@ -38,6 +54,27 @@ class TestTimesFMForecaster:
 
         assert isinstance(last_date, pd.Timestamp)
 
+    def test_get_last_date_with_datetime_in_inner_level(self):
+        """Test that the datetime level is found from the last index tuple"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        forecaster = TimesFMForecaster()
+        index = pd.MultiIndex.from_product(
+            [["store1", "store2"], pd.date_range("2024-01-01", periods=3)],
+            names=["store", "date"],
+        )
+        df = pd.DataFrame({"product_a": np.arange(6.0)}, index=index)
+
+        with patch.object(
+            pd.MultiIndex, "get_level_values", side_effect=AssertionError
+        ):
+            last_date = forecaster._get_last_date(df)
+
+        assert last_date == pd.Timestamp("2024-01-03")
+
     def test_get_last_date_with_datetime_index(self):
         """Test _get_last_date with regular DatetimeIndex"""
         try:
@@ -72,3 +109,502 @@ class TestTimesFMForecaster:
 
         with pytest.raises(ValueError, match="Could not parse index value"):
             forecaster._get_last_date(df)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_format_quantile_forecast_matches_str_join(self, dtype):
+        """Test that quantile cells render every value exactly as str() does"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        forecaster = TimesFMForecaster()
+        rng = np.random.default_rng(0)
+        forecast_quantile = (rng.standard_normal((2, 3, 4)) * 1000).astype(dtype)
+        forecast_quantile[0, 0, 0] = np.nan
+        forecast_quantile[1, 2, 3] = 1e16
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0], "product_b": [3.0, 4.0]},
+            index=pd.date_range("2024-01-01", periods=2),
+        )
+
+        result = forecaster._format_quantile_forecast(
+            forecast_quantile, df, 3, pd.Timestamp("2024-01-02")
+        )
+
+        assert list(result.columns) == ["date", "product_a", "product_b"]
+        for item, column in enumerate(["product_a", "product_b"]):
+            for horizon in range(3):
+                expected = "|".join(map(str, forecast_quantile[item, horizon, :]))
+                assert result[column].iloc[horizon] == expected
+
+    @pytest.mark.parametrize(
+        "frequency, last_date, expected",
+        [
+            ("D", "2024-01-31", ["2024-02-01", "2024-02-02"]),
+            ("H", "2024-01-31 23:00", ["2024-02-01 00:00", "2024-02-01 01:00"]),
+            ("W", "2024-01-07", ["2024-01-14", "2024-01-21"]),
+            ("M", "2024-01-31", ["2024-02-29", "2024-03-31"]),
+            ("MS", "2024-01-01", ["2024-02-01", "2024-03-01"]),
+            # Last dates that are not on an anchored offset must not skip
+            # the first period
+            ("W", "2024-01-03", ["2024-01-14", "2024-01-21"]),
+            ("MS", "2024-01-15", ["2024-02-01", "2024-03-01"]),
+        ],
+    )
+    def test_forecast_dates_start_one_period_after_last_date(
+        self, frequency, last_date, expected
+    ):
+        """Test that forecast dates follow the configured frequency"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        forecaster = TimesFMForecaster(frequency=frequency)
+
+        dates = forecaster._forecast_dates(pd.Timestamp(last_date), 2)
+
+        assert list(dates) == [pd.Timestamp(value) for value in expected]
+
+    def test_invalid_frequency_raises_error_at_construction(self):
+        """Test that an unknown frequency fails before any forecast"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with pytest.raises(ValueError):
+            TimesFMForecaster(frequency="not-a-frequency")
+
+
+class TestTimesFMTorchCompile:
+    """Tests for the optional torch.compile path of TimesFMForecaster"""
+
+    MODULE = "chronomaly.infrastructure.forecasters.timesfm"
+
+    def _mock_model(self):
+        import torch
+
+        class Inner(torch.nn.Module):
+            def forward(self, x):
+                return x
+
+        model = MagicMock()
+        model.model = Inner()
+        return model
+
+    def test_torch_compile_disabled_by_default(self):
+        """Test that the model is not wrapped unless requested"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        model = self._mock_model()
+        with (
+            patch(
+                f"{self.MODULE}.timesfm.TimesFM_2p5_200M_torch.from_pretrained",
+                return_value=model,
+            ),
+            patch(f"{self.MODULE}.torch.compile") as mock_compile,
+        ):
+            TimesFMForecaster()._get_model()
+
+        mock_compile.assert_not_called()
+        model.forecast.assert_not_called()
+
+    def test_torch_compile_wraps_forward_and_warms_up(self):
+        """Test that forward is compiled and warmed up at max context/horizon"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        model = self._mock_model()
+        compiled_forward = object()
+        with (
+            patch(
+                f"{self.MODULE}.timesfm.TimesFM_2p5_200M_torch.from_pretrained",
+                return_value=model,
+            ),
+            patch(
+                f"{self.MODULE}.torch.compile", return_value=compiled_forward
+            ) as mock_compile,
+        ):
+            forecaster = TimesFMForecaster(
+                max_context=32, max_horizon=8, use_torch_compile=True
+            )
+            forecaster._get_model()
+
+        assert mock_compile.call_args[1]["mode"] == "reduce-overhead"
+        assert mock_compile.call_args[1]["dynamic"] is True
+        assert model.model.forward is compiled_forward
+        assert forecaster._compiled_model is model.model
+
+        warmup_kwargs = model.forecast.call_args[1]
+        assert warmup_kwargs["horizon"] == 8
+        assert len(warmup_kwargs["inputs"][0]) == 32
+
+    def test_torch_compile_failure_falls_back_to_eager(self):
+        """Test that a failing compile restores the eager forward"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        model = self._mock_model()
+        model.forecast.side_effect = RuntimeError("no compiler")
+        eager_forward = model.model.forward
+        with (
+            patch(
+                f"{self.MODULE}.timesfm.TimesFM_2p5_200M_torch.from_pretrained",
+                return_value=model,
+            ),
+            patch(f"{self.MODULE}.torch.compile", return_value=object()),
+        ):
+            forecaster = TimesFMForecaster(use_torch_compile=True)
+            with pytest.warns(UserWarning, match="falling back to eager"):
+                assert forecaster._get_model() is model
+
+        assert model.model.forward == eager_forward
+        assert forecaster._compiled_model is None
+
+
+class TestTimesFMModelCache:
+    """Tests for the class-level TimesFM model cache"""
+
+    FROM_PRETRAINED = (
+        "chronomaly.infrastructure.forecasters.timesfm."
+        "timesfm.TimesFM_2p5_200M_torch.from_pretrained"
+    )
+
+    def _patch_from_pretrained(self):
+        return patch(self.FROM_PRETRAINED, side_effect=lambda *a, **k: MagicMock())
+
+    def test_same_configuration_shares_model(self):
+        """Test that forecasters with equal settings load the model once"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with self._patch_from_pretrained() as mock_from_pretrained:
+            first = TimesFMForecaster(max_context=64)._get_model()
+            second = TimesFMForecaster(max_context=64)._get_model()
+            other = TimesFMForecaster(max_context=128)._get_model()
+
+        assert first is second
+        assert other is not first
+        assert mock_from_pretrained.call_count == 2
+        first.compile.assert_called_once()
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache keeps at most MODEL_CACHE_SIZE models"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with self._patch_from_pretrained() as mock_from_pretrained:
+            for max_context in range(1, TimesFMForecaster.MODEL_CACHE_SIZE + 2):
+                TimesFMForecaster(max_context=max_context)._get_model()
+            TimesFMForecaster(max_context=1)._get_model()
+
+        assert len(TimesFMForecaster._MODEL_CACHE) == TimesFMForecaster.MODEL_CACHE_SIZE
+        assert mock_from_pretrained.call_count == TimesFMForecaster.MODEL_CACHE_SIZE + 2
+
+    def test_clear_model_cache_forces_reload(self):
+        """Test that clearing the cache loads the model again"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with self._patch_from_pretrained() as mock_from_pretrained:
+            first = TimesFMForecaster()._get_model()
+            TimesFMForecaster.clear_model_cache()
+            second = TimesFMForecaster()._get_model()
+
+        assert first is not second
+        assert mock_from_pretrained.call_count == 2
+
+
+class TestTimesFMForecastInputs:
+    """Tests for how TimesFMForecaster.forecast() feeds the model"""
+
+    FROM_PRETRAINED = TestTimesFMModelCache.FROM_PRETRAINED
+
+    def _mock_model(self, n_series, horizon):
+        model = MagicMock()
+        point = np.zeros((n_series, horizon), dtype=np.float32)
+        model.forecast.return_value = (point, np.zeros((n_series, horizon, 10)))
+        return model
+
+    def test_series_passed_in_one_batched_call(self):
+        """Test that all columns go to the model as one float32 batch"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {
+                "product_a": [1, 2, 3],
+                "product_b": [4.5, np.nan, 6.5],
+                "product_c": pd.array([7, None, 9], dtype="Int64"),
+            },
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+        model = self._mock_model(n_series=3, horizon=2)
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            result = TimesFMForecaster().forecast(df, horizon=2, return_point=True)
+
+        model.forecast.assert_called_once()
+        inputs = model.forecast.call_args[1]["inputs"]
+        assert len(inputs) == 3
+        for series, column in zip(inputs, df.columns):
+            assert series.dtype == np.float32
+            assert series.flags["C_CONTIGUOUS"]
+            np.testing.assert_array_equal(
+                series, df[column].astype("float64").to_numpy(na_value=np.nan)
+            )
+        assert list(result.columns) == ["date", "product_a", "product_b", "product_c"]
+
+    def test_non_numeric_column_raises_error(self):
+        """Test that non-numeric series are rejected before calling the model"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": ["x", "y"]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+        model = self._mock_model(n_series=1, horizon=1)
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            with pytest.raises(ValueError, match="must be numeric"):
+                TimesFMForecaster().forecast(df, horizon=1)
+
+        model.forecast.assert_not_called()
+
+    def test_invalid_index_fails_before_loading_model(self):
+        """Test that the last date is resolved before the model is loaded"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame({"product_a": [1.0, 2.0]}, index=["a", "b"])
+
+        with patch(self.FROM_PRETRAINED) as mock_from_pretrained:
+            with pytest.raises(ValueError, match="Could not parse index value"):
+                TimesFMForecaster().forecast(df, horizon=1)
+
+        mock_from_pretrained.assert_not_called()
+
+    def test_model_runs_in_inference_mode(self):
+        """Test that the forecast call runs without autograd tracking"""
+        try:
+            import torch
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+        model = self._mock_model(n_series=1, horizon=1)
+        modes = []
+
+        def record_mode(**kwargs):
+            modes.append(torch.is_inference_mode_enabled())
+            return model.forecast.return_value
+
+        model.forecast.side_effect = record_mode
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            TimesFMForecaster().forecast(df, horizon=1)
+
+        assert modes == [True]
+        assert not torch.is_inference_mode_enabled()
+
+    def test_autocast_applied_when_dtype_set(self):
+        """Test that autocast_dtype wraps the forecast call in torch.autocast"""
+        try:
+            import torch
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+        model = self._mock_model(n_series=1, horizon=1)
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            with patch.object(torch, "autocast") as mock_autocast:
+                TimesFMForecaster().forecast(df, horizon=1)
+                mock_autocast.assert_not_called()
+
+                forecaster = TimesFMForecaster(autocast_dtype=torch.bfloat16)
+                forecaster.forecast(df, horizon=1)
+
+        mock_autocast.assert_called_once()
+        assert mock_autocast.call_args[1]["dtype"] == torch.bfloat16
+
+    def test_invalid_autocast_dtype_raises_error(self):
+        """Test that only reduced precision float dtypes are accepted"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with pytest.raises(ValueError, match="autocast_dtype"):
+            TimesFMForecaster(autocast_dtype="int8")
+
+    def test_auto_device_falls_back_to_cpu(self):
+        """Test that device='auto' resolves to CPU when CUDA is unavailable"""
+        try:
+            import torch
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with patch.object(torch.cuda, "is_available", return_value=False):
+            forecaster = TimesFMForecaster()
+
+        assert forecaster.device == torch.device("cpu")
+
+    def test_model_moved_to_configured_device(self):
+        """Test that the PyTorch module and its input device follow 'device'"""
+        try:
+            import torch
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        class Inner(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.device = None
+
+        model = MagicMock()
+        model.model = Inner()
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            TimesFMForecaster(device="cpu")._get_model()
+
+        assert model.model.device == torch.device("cpu")
+        model.compile.assert_called_once()
+
+    def test_invalid_device_raises_error(self):
+        """Test that an unknown device string is rejected at construction"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with pytest.raises(ValueError, match="Invalid device"):
+            TimesFMForecaster(device="not-a-device")
+
+    def test_date_column_python_dates_by_default(self):
+        """Test that forecast dates are datetime.date objects by default"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+        model = self._mock_model(n_series=1, horizon=2)
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            result = TimesFMForecaster().forecast(df, horizon=2, return_point=True)
+
+        assert result["date"].tolist() == [date(2024, 1, 3), date(2024, 1, 4)]
+
+    def test_date_column_kept_as_datetime64(self):
+        """Test that date_as_python_date=False keeps a datetime64 column"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+        model = self._mock_model(n_series=1, horizon=2)
+
+        with patch(self.FROM_PRETRAINED, return_value=model):
+            forecaster = TimesFMForecaster(date_as_python_date=False)
+            point = forecaster.forecast(df, horizon=2, return_point=True)
+            quantile = forecaster.forecast(df, horizon=2)
+
+        for result in (point, quantile):
+            assert pd.api.types.is_datetime64_dtype(result["date"])
+            assert result["date"].iloc[0] == pd.Timestamp("2024-01-03")
+
+
+class TestTimesFMPreload:
+    """Tests for loading the TimesFM model on a background thread"""
+
+    FROM_PRETRAINED = TestTimesFMModelCache.FROM_PRETRAINED
+
+    def test_preload_loads_model_in_background(self):
+        """Test that preload=True loads the model once, before any forecast"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        model = MagicMock()
+        model.forecast.return_value = (np.zeros((1, 1)), np.zeros((1, 1, 10)))
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+
+        with patch(self.FROM_PRETRAINED, return_value=model) as mock_from_pretrained:
+            forecaster = TimesFMForecaster(preload=True)
+            forecaster._preload_thread.join(timeout=10)
+            assert mock_from_pretrained.call_count == 1
+
+            forecaster.forecast(df, horizon=1)
+
+        assert mock_from_pretrained.call_count == 1
+        assert forecaster._model is model
+
+    def test_preload_failure_warns_and_defers_error(self):
+        """Test that a failed preload surfaces its error on forecast()"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        df = pd.DataFrame(
+            {"product_a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)
+        )
+
+        with patch(self.FROM_PRETRAINED, side_effect=OSError("offline")):
+            with pytest.warns(UserWarning, match="preload failed"):
+                forecaster = TimesFMForecaster(preload=True)
+                forecaster._preload_thread.join(timeout=10)
+
+            with pytest.raises(OSError, match="offline"):
+                forecaster.forecast(df, horizon=1)
+
+    def test_no_preload_by_default(self):
+        """Test that the model is loaded lazily unless preload is requested"""
+        try:
+            from chronomaly.infrastructure.forecasters import TimesFMForecaster
+        except ImportError:
+            pytest.skip("timesfm not installed")
+
+        with patch(self.FROM_PRETRAINED) as mock_from_pretrained:
+            forecaster = TimesFMForecaster()
+
+        assert forecaster._preload_thread is None
+        mock_from_pretrained.assert_not_called()
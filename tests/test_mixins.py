@@ -0,0 +1,118 @@
+"""
+Tests for shared mixins.
+"""
+
+import pytest
+import pandas as pd
+from chronomaly.shared import TransformableMixin
+from chronomaly.infrastructure.data.writers.databases import SQLiteDataWriter
+from chronomaly.infrastructure.transformers.filters import ValueFilter
+from chronomaly.infrastructure.transformers.formatters import ColumnSelector
+
+
+class Component(TransformableMixin):
+    """Minimal component using the mixin"""
+
+    def __init__(self, transformers=None):
+        self.transformers = transformers or {}
+
+
+class TestTransformableMixin:
+    """Tests for TransformableMixin"""
+
+    def test_transformers_applied_in_order(self):
+        """Test that filters, formatters and callables run in list order"""
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        component = Component(
+            transformers={
+                "after": [
+                    ValueFilter(column="a", min_value=2),
+                    ColumnSelector(columns="b", mode="drop"),
+                    lambda d: d.assign(c=d["a"] * 10),
+                ]
+            }
+        )
+
+        result = component._apply_transformers(df, "after")
+
+        assert list(result.columns) == ["a", "c"]
+        assert result["c"].tolist() == [20, 30]
+
+    def test_missing_stage_returns_input(self):
+        """Test that a stage without transformers returns the input unchanged"""
+        df = pd.DataFrame({"a": [1]})
+        component = Component(transformers={"after": [lambda d: d.iloc[0:0]]})
+
+        assert component._apply_transformers(df, "before") is df
+
+    def test_dispatch_resolved_at_assignment(self):
+        """Test that transformers are resolved to callables when assigned"""
+        value_filter = ValueFilter(column="a", min_value=2)
+        component = Component(transformers={"before": [value_filter]})
+
+        assert component._transformer_fns["before"][1] == [value_filter.filter]
+
+    def test_reassigning_transformers_updates_dispatch(self):
+        """Test that replacing transformers re-resolves the dispatch table"""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        component = Component()
+        assert component._apply_transformers(df, "after") is df
+
+        component.transformers = {"after": [lambda d: d.head(1)]}
+
+        assert len(component._apply_transformers(df, "after")) == 1
+
+    def test_transformers_mutated_in_place_are_applied(self):
+        """Test that transformers appended to an assigned list still run"""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        component = Component(transformers={"after": [lambda d: d.head(2)]})
+        component._apply_transformers(df, "after")
+
+        component.transformers["after"].append(lambda d: d.head(1))
+        component.transformers["before"] = [lambda d: d.iloc[0:0]]
+
+        assert len(component._apply_transformers(df, "after")) == 1
+        assert component._apply_transformers(df, "before").empty
+
+    def test_invalid_transformer_raises_error_at_construction(self):
+        """Test that a transformer without a usable interface fails fast"""
+        with pytest.raises(TypeError, match="Transformer must have"):
+            Component(transformers={"after": [42]})
+
+    def test_component_without_transformers_returns_input(self):
+        """Test that components that never set transformers are a no-op"""
+
+        class Bare(TransformableMixin):
+            pass
+
+        df = pd.DataFrame({"a": [1]})
+
+        assert Bare()._apply_transformers(df, "after") is df
+
+    def test_writers_do_not_probe_transformers_per_call(self, tmp_path):
+        """Test that writers reuse the dispatch resolved at construction"""
+
+        class CountingFilter:
+            lookups = 0
+
+            def __getattribute__(self, name):
+                if name == "filter":
+                    type(self).lookups += 1
+                return object.__getattribute__(self, name)
+
+            def filter(self, df):
+                return df
+
+        writer = SQLiteDataWriter(
+            str(tmp_path / "test.db"),
+            "forecast",
+            if_exists="append",
+            transformers={"before": [CountingFilter()]},
+        )
+        lookups_after_init = CountingFilter.lookups
+
+        for value in range(3):
+            writer.write(pd.DataFrame({"value": [value]}))
+        writer.close()
+
+        assert CountingFilter.lookups == lookups_after_init
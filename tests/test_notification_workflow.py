@@ -4,6 +4,7 @@ Tests for notification workflow and components.
 
 import os
 import pytest
+import numpy as np
 import pandas as pd
 import tempfile
 from pathlib import Path
@@ -214,6 +215,74 @@ class TestEmailNotifier:
         with pytest.raises(ValueError, match="Recipient list cannot be empty"):
             EmailNotifier(to=[], template_path=email_template_file)
 
+    def test_non_string_recipient_raises_error(self, email_template_file):
+        """Test that a non-string recipient in the list raises TypeError"""
+        with pytest.raises(TypeError, match="All recipients must be strings"):
+            EmailNotifier(
+                to=["user1@example.com", 42], template_path=email_template_file
+            )
+
+    def test_subject_replaces_every_date_placeholder(self, email_template_file):
+        """Test that repeated and mixed date placeholders are all replaced"""
+        from datetime import datetime
+
+        notifier = EmailNotifier(
+            to="test@example.com",
+            template_path=email_template_file,
+            subject="{date:%d.%m} / {date} / {date:%Y} / {date:%d.%m}",
+        )
+
+        subject = notifier._get_email_subject(datetime(2024, 3, 5))
+
+        assert subject == "05.03 / 2024-03-05 / 2024 / 05.03"
+
+    @pytest.mark.parametrize(
+        "dates",
+        [
+            ["2024-03-01", "2024-03-05", None],
+            pd.to_datetime(["2024-03-01", "2024-03-05", None]),
+        ],
+    )
+    @patch("smtplib.SMTP")
+    def test_anomaly_date_is_latest_date(self, mock_smtp, email_template_file, dates):
+        """Test that the subject date is the latest date for any date dtype"""
+        from datetime import datetime
+
+        df = pd.DataFrame({"date": dates, "metric": ["a", "b", "c"]})
+        notifier = EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        )
+
+        with patch.object(notifier, "_send_email") as mock_send:
+            notifier.notify({"anomalies": df})
+
+        assert mock_send.call_args.args[1] == datetime(2024, 3, 5)
+
+    @patch("smtplib.SMTP")
+    def test_subject_date_is_per_payload(self, mock_smtp, email_template_file):
+        """Test that each email's subject uses its own payload's date"""
+        from datetime import datetime
+
+        mock_server = MagicMock()
+        mock_smtp.return_value = mock_server
+        notifier = EmailNotifier(
+            to="test@example.com",
+            template_path=email_template_file,
+            subject="Alert {date}",
+        )
+
+        with notifier:
+            first = notifier._generate_html_body(pd.DataFrame({"metric": ["a"]}))
+            notifier.notify(
+                {"anomalies": pd.DataFrame({"date": ["2024-02-02"], "metric": ["b"]})}
+            )
+            notifier._send_email(first, datetime(2024, 1, 1))
+
+        subjects = [
+            call.args[0]["Subject"] for call in mock_server.send_message.call_args_list
+        ]
+        assert subjects == ["Alert 2024-02-02", "Alert 2024-01-01"]
+
     def test_invalid_recipient_type_raises_error(self, email_template_file):
         """Test that invalid recipient type raises TypeError"""
         with pytest.raises(TypeError, match="must be a string or list"):
@@ -368,6 +437,88 @@ class TestEmailNotifier:
         mock_server.login.assert_called_once()
         mock_server.send_message.assert_called_once()
 
+    @patch("smtplib.SMTP")
+    def test_to_header_lists_all_recipients(self, mock_smtp, email_template_file):
+        """Test that the To header joins every recipient"""
+        notifier = EmailNotifier(
+            to=["user1@example.com", "user2@example.com"],
+            template_path=email_template_file,
+        )
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        notifier.notify({"anomalies": pd.DataFrame({"metric": ["sales"]})})
+
+        message = mock_server.send_message.call_args[0][0]
+        assert message["To"] == "user1@example.com, user2@example.com"
+
+    @patch("smtplib.SMTP")
+    def test_attach_images_sends_charts_as_cid_parts(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that data URI images become inline parts referenced by cid"""
+        import base64
+
+        png = b"\x89PNG\r\n\x1a\nchart"
+        img = f'<img src="data:image/png;base64,{base64.b64encode(png).decode()}">'
+        df = pd.DataFrame({"metric": ["a", "b"], "chart": [img, img]})
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        notifier = EmailNotifier(
+            to="test@example.com",
+            template_path=email_template_file,
+            attach_images=True,
+        )
+        notifier.notify({"anomalies": df})
+
+        message = mock_server.send_message.call_args[0][0]
+        related = message.get_payload()[0]
+        assert related.get_content_type() == "multipart/related"
+        html_part, image_part = related.get_payload()
+        html_content = html_part.get_payload(decode=True).decode("utf-8")
+        assert "data:image" not in html_content
+        assert html_content.count('<img src="cid:image1">') == 2
+        assert image_part.get_content_type() == "image/png"
+        assert image_part["Content-ID"] == "<image1>"
+        assert image_part.get_payload(decode=True) == png
+
+    @pytest.mark.parametrize(
+        "cell, encoding",
+        [("sales", "7bit"), ("x" * 2000, "base64")],
+    )
+    @patch("smtplib.SMTP")
+    def test_html_body_respects_smtp_line_limit(
+        self, mock_smtp, tmp_path, cell, encoding
+    ):
+        """Test that the body is only base64-encoded when a line is too long"""
+        template_file = tmp_path / "template.html"
+        template_file.write_text("<html><body>{{ table }}</body></html>")
+        df = pd.DataFrame({"metric": [cell] * 50, "value": range(50)})
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        notifier = EmailNotifier(
+            to="test@example.com", template_path=str(template_file)
+        )
+        notifier.notify({"anomalies": df})
+
+        message = mock_server.send_message.call_args[0][0]
+        html_part = message.get_payload()[0]
+        assert html_part["Content-Transfer-Encoding"] == encoding
+        assert max(map(len, message.as_string().splitlines())) <= 998
+        assert cell in html_part.get_payload(decode=True).decode("utf-8")
+
+    def test_long_line_check_near_limit(self):
+        """Test the line limit boundary on a body of lines just under it"""
+        from chronomaly.infrastructure.notifiers.email import _has_long_line
+
+        near_limit = "\n".join(["x" * 998] * 2000)
+
+        assert not _has_long_line(near_limit)
+        assert not _has_long_line(near_limit.replace("\n", "\r\n"))
+        assert _has_long_line(near_limit + "\n" + "x" * 999)
+
     @patch("smtplib.SMTP")
     def test_html_generation(self, mock_smtp, email_template_file):
         """Test HTML email content generation"""
@@ -404,6 +555,264 @@ class TestEmailNotifier:
         assert "100.5" in html_content  # Pandas native output
         assert "sales" in html_content
 
+    def test_table_html_matches_styler_formatting(self, email_template_file):
+        """Test that the table keeps Styler's cell formatting without the index"""
+        df = pd.DataFrame(
+            {
+                "metric": ["sales", "visits"],
+                "actual": [100.5, float("nan")],
+                "count": [3, 4],
+                "chart": ['<img src="data:image/png;base64,AAA">', None],
+            },
+            index=[10, 20],
+        )
+
+        notifier = EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        )
+        table_html = notifier._build_table_html(df)
+
+        assert table_html.startswith('<table class="anomaly-table"')
+        assert table_html.count("<tr>") == 3
+        assert ">metric</th>" in table_html
+        assert ">100.500000</td>" in table_html
+        assert ">nan</td>" in table_html
+        assert ">3</td>" in table_html
+        assert '<img src="data:image/png;base64,AAA">' in table_html
+        assert ">None</td>" in table_html
+        assert ">10</td>" not in table_html
+
+    def test_escape_html_escapes_table_cells(self, email_template_file):
+        """Test that escape_html escapes headers and cell values"""
+        df = pd.DataFrame({"<b>metric</b>": ["<script>x</script>", "a & b"]})
+
+        notifier = EmailNotifier(
+            to="test@example.com",
+            template_path=email_template_file,
+            escape_html=True,
+        )
+        table_html = notifier._build_table_html(df)
+
+        assert ">&lt;b&gt;metric&lt;/b&gt;</th>" in table_html
+        assert ">&lt;script&gt;x&lt;/script&gt;</td>" in table_html
+        assert ">a &amp; b</td>" in table_html
+        assert "<script>" not in table_html
+
+        default_notifier = EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        )
+        assert "<script>x</script>" in default_notifier._build_table_html(df)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["ABOVE_UPPER", None],
+            [1, 2],
+            [True, False],
+            [1.5, "a"],
+            [1.25, float("nan")],
+            pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            pd.array([1.25, None], dtype="Float64"),
+            pd.array([1.25, None], dtype="float64[pyarrow]"),
+            [1 + 2j, complex("nan")],
+            [1, "a", 2.5],
+            pd.Series([np.float32(1.5), "a"], dtype=object),
+            pd.Series([np.float32(1.5), None], dtype=object),
+        ],
+    )
+    def test_format_column_matches_styler(self, values):
+        """Test that column formatting renders cells like pandas Styler did"""
+        import re
+
+        df = pd.DataFrame({"col": values})
+        styler_cells = re.findall(
+            r"<td[^>]*>(.*?)</td>", df.style.hide(axis="index").to_html(escape=False)
+        )
+
+        assert EmailNotifier._format_column(df["col"], 6) == styler_cells
+
+    @patch("smtplib.SMTP")
+    def test_template_compiled_once(self, mock_smtp, email_template_file):
+        """Test that a template is compiled once and shared between notifiers"""
+        from jinja2 import Template
+        from chronomaly.infrastructure.notifiers.email import _compile_template
+
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        _compile_template.cache_clear()
+
+        with patch(
+            "chronomaly.infrastructure.notifiers.email.Template", wraps=Template
+        ) as mock_template:
+            notifiers = [
+                EmailNotifier(to="test@example.com", template_path=email_template_file)
+                for _ in range(2)
+            ]
+            for notifier in notifiers:
+                notifier.notify({"anomalies": df})
+                notifier.notify({"anomalies": df})
+
+        assert mock_template.call_count == 1
+        assert notifiers[0]._template is notifiers[1]._template
+
+    @patch("smtplib.SMTP")
+    def test_context_manager_reuses_smtp_connection(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that notifications in a with block share one SMTP session"""
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+
+        with EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        ) as notifier:
+            notifier.notify({"anomalies": df})
+            notifier.notify({"anomalies": df})
+
+        assert mock_smtp.call_count == 1
+        mock_server.starttls.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_called_once()
+        assert notifier._smtp_conn is None
+
+    @patch("smtplib.SMTP")
+    def test_notify_many_sends_over_one_session(self, mock_smtp, email_template_file):
+        """Test that notify_many sends every payload over one SMTP session"""
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+
+        notifier = EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        )
+        notifier.notify_many([{"anomalies": df}] * 3)
+
+        assert mock_smtp.call_count == 1
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 3
+        mock_server.quit.assert_called_once()
+        assert notifier._smtp_conn is None
+        assert notifier._keep_connection is False
+
+    @patch("smtplib.SMTP")
+    def test_notify_many_leaves_context_manager_session_open(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that notify_many inside a with block keeps the session open"""
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+
+        with EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        ) as notifier:
+            notifier.notify_many([{"anomalies": df}] * 2)
+            mock_server.quit.assert_not_called()
+            notifier.notify({"anomalies": df})
+
+        assert mock_smtp.call_count == 1
+        assert mock_server.send_message.call_count == 3
+        mock_server.quit.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_notify_async_sends_in_background(self, mock_smtp, email_template_file):
+        """Test that notify_async queues sends and close() waits for them"""
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+
+        with EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        ) as notifier:
+            futures = [notifier.notify_async({"anomalies": df}) for _ in range(3)]
+
+        assert all(future.done() for future in futures)
+        assert mock_smtp.call_count == 1
+        assert mock_server.send_message.call_count == 3
+        mock_server.quit.assert_called_once()
+        assert notifier._executor is None
+
+    @patch("smtplib.SMTP")
+    def test_notify_async_error_is_raised_by_future(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that a failed background send surfaces through its Future"""
+        import smtplib
+
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = MagicMock()
+        mock_server.send_message.side_effect = smtplib.SMTPException("boom")
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        notifier = EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        )
+        future = notifier.notify_async({"anomalies": df})
+        notifier.flush()
+
+        with pytest.raises(RuntimeError):
+            future.result()
+
+    @patch("smtplib.SMTP")
+    def test_shared_smtp_connection_is_used_by_one_thread_at_a_time(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that threads sharing a notifier don't interleave SMTP commands"""
+        import threading
+        import time
+
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b"OK")
+        active, overlaps = [], []
+
+        def send_message(msg):
+            overlaps.append(bool(active))
+            active.append(msg)
+            time.sleep(0.01)
+            active.remove(msg)
+
+        mock_server.send_message.side_effect = send_message
+
+        with EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        ) as notifier:
+            threads = [
+                threading.Thread(target=notifier.notify, args=({"anomalies": df},))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_smtp.call_count == 1
+        assert overlaps == [False] * 4
+
+    @patch("smtplib.SMTP")
+    def test_context_manager_reconnects_dropped_connection(
+        self, mock_smtp, email_template_file
+    ):
+        """Test that a connection failing NOOP is replaced before sending"""
+        import smtplib
+
+        df = pd.DataFrame({"metric": ["sales"], "status": ["ABOVE_UPPER"]})
+        stale_server, fresh_server = MagicMock(), MagicMock()
+        stale_server.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp.side_effect = [stale_server, fresh_server]
+
+        with EmailNotifier(
+            to="test@example.com", template_path=email_template_file
+        ) as notifier:
+            notifier.notify({"anomalies": df})
+            notifier.notify({"anomalies": df})
+
+        assert mock_smtp.call_count == 2
+        stale_server.close.assert_called_once()
+        stale_server.send_message.assert_called_once()
+        fresh_server.send_message.assert_called_once()
+
     def test_missing_template_path_raises_error(self):
         """Test that missing template_path raises ValueError"""
         with pytest.raises(ValueError, match="template_path cannot be empty"):
@@ -1080,6 +1489,49 @@ class TestNotificationWorkflow:
         with pytest.raises(RuntimeError, match="Failed to send notification via Mock"):
             workflow.run()
 
+    def test_run_with_max_workers_overlaps_notifiers(self):
+        """Test that max_workers > 1 runs notifiers concurrently"""
+        import threading
+
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        barrier = threading.Barrier(2, timeout=5)
+        notifiers = [Mock(spec=Notifier) for _ in range(2)]
+        for notifier in notifiers:
+            # Only passes if both notifiers are inside notify() at once
+            notifier.notify.side_effect = lambda payload: barrier.wait()
+
+        workflow = NotificationWorkflow(
+            anomalies_data=df, notifiers=notifiers, max_workers=2
+        )
+        workflow.run()
+
+        for notifier in notifiers:
+            notifier.notify.assert_called_once()
+
+    def test_run_with_max_workers_reports_failure_after_all_notifiers(self):
+        """Test that a failing notifier doesn't stop the others"""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        failing = Mock(spec=Notifier)
+        failing.notify.side_effect = Exception("SMTP connection failed")
+        other = Mock(spec=Notifier)
+
+        workflow = NotificationWorkflow(
+            anomalies_data=df, notifiers=[failing, other], max_workers=2
+        )
+
+        with pytest.raises(RuntimeError, match="SMTP connection failed"):
+            workflow.run()
+        other.notify.assert_called_once()
+
+    def test_invalid_max_workers_raises_error(self):
+        """Test that max_workers must be a positive integer"""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+
+        with pytest.raises(ValueError, match="max_workers"):
+            NotificationWorkflow(
+                anomalies_data=df, notifiers=[Mock(spec=Notifier)], max_workers=0
+            )
+
     def test_integration_with_email_notifier(self, email_template_file):
         """Integration test with actual EmailNotifier"""
         df = pd.DataFrame(
@@ -7,6 +7,7 @@ import pandas as pd
 import base64
 from chronomaly.infrastructure.visualizers import TimeSeriesVisualizer
 from chronomaly.infrastructure.data.readers import DataFrameDataReader
+from chronomaly.infrastructure.data.readers.base import DataReader
 
 
 class TestTimeSeriesVisualizerInit:
@@ -53,6 +54,15 @@ class TestTimeSeriesVisualizerInit:
                 history_data=[1, 2, 3],  # Not a DataReader
             )
 
+    def test_init_with_invalid_max_workers_raises_error(self):
+        """Test that a non-positive max_workers raises ValueError."""
+        reader = DataFrameDataReader(pd.DataFrame({"group_key": ["metric_a"]}))
+
+        with pytest.raises(ValueError, match="max_workers must be a positive"):
+            TimeSeriesVisualizer(
+                anomaly_data=reader, history_data=reader, max_workers=0
+            )
+
 
 class TestGenerateCharts:
     """Tests for generate_charts method."""
@@ -165,6 +175,51 @@ class TestGenerateCharts:
 
         assert "metric_a" not in charts
 
+    def test_generate_charts_skips_history_load_without_anomalies(self):
+        """Test that history data is not loaded when there are no anomalies."""
+        from unittest.mock import MagicMock
+
+        history_reader = MagicMock(spec=DataReader)
+
+        visualizer = TimeSeriesVisualizer(
+            anomaly_data=DataFrameDataReader(pd.DataFrame({"group_key": []})),
+            history_data=history_reader,
+        )
+
+        assert visualizer.generate_charts() == {}
+        history_reader.load.assert_not_called()
+
+    def test_generate_charts_with_max_workers_matches_sequential(self):
+        """Test that parallel rendering returns the same charts in order."""
+        anomaly_df = pd.DataFrame(
+            {"group_key": ["metric_b", "metric_a", "metric_c"], "value": [1, 2, 3]}
+        )
+        history_df = pd.DataFrame(
+            {
+                "metric_a": [10, 20, 30],
+                "metric_b": [5, 15, 10],
+                "metric_c": [float("nan")] * 3,
+            },
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+        sequential = TimeSeriesVisualizer(
+            anomaly_data=DataFrameDataReader(anomaly_df),
+            history_data=DataFrameDataReader(history_df),
+        )
+        parallel = TimeSeriesVisualizer(
+            anomaly_data=DataFrameDataReader(anomaly_df),
+            history_data=DataFrameDataReader(history_df),
+            max_workers=2,
+        )
+
+        charts = parallel.generate_charts()
+
+        assert list(charts) == ["metric_b", "metric_a"]
+        assert charts.keys() == sequential.generate_charts().keys()
+        for chart in charts.values():
+            assert base64.b64decode(chart)[:8] == b"\x89PNG\r\n\x1a\n"
+
 
 class TestSaveCharts:
     """Tests for save_charts method."""
@@ -248,3 +303,137 @@ class TestGetFigures:
         # Cleanup
         for fig in figures.values():
             plt.close(fig)
+
+
+class TestHistoryCache:
+    """Tests for history_cache_ttl."""
+
+    @staticmethod
+    def _visualizer(history_reader, **kwargs):
+        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
+        return TimeSeriesVisualizer(
+            anomaly_data=DataFrameDataReader(anomaly_df),
+            history_data=history_reader,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _history_reader():
+        from unittest.mock import MagicMock
+
+        history_reader = MagicMock(spec=DataReader)
+        history_reader.load.return_value = pd.DataFrame(
+            {"metric_a": [10, 20, 30]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+        return history_reader
+
+    def test_history_loaded_every_call_by_default(self):
+        """Test that history data is reloaded when caching is disabled."""
+        history_reader = self._history_reader()
+        visualizer = self._visualizer(history_reader)
+
+        visualizer.generate_charts()
+        visualizer.generate_charts()
+
+        assert history_reader.load.call_count == 2
+
+    def test_history_reused_within_ttl_and_reloaded_after(self):
+        """Test that history data is reused until the TTL expires."""
+        from unittest.mock import patch
+
+        history_reader = self._history_reader()
+        visualizer = self._visualizer(history_reader, history_cache_ttl=300)
+
+        with patch(
+            "chronomaly.infrastructure.visualizers.timeseries.time.monotonic"
+        ) as monotonic:
+            monotonic.return_value = 1000.0
+            visualizer.generate_charts()
+            monotonic.return_value = 1299.0
+            figures = visualizer.get_figures()
+            assert history_reader.load.call_count == 1
+
+            monotonic.return_value = 1300.0
+            visualizer.generate_charts()
+            assert history_reader.load.call_count == 2
+
+        # Cleanup
+        import matplotlib.pyplot as plt
+
+        for fig in figures.values():
+            plt.close(fig)
+
+    def test_clear_history_cache_forces_reload(self):
+        """Test that clear_history_cache makes the next call reload history."""
+        history_reader = self._history_reader()
+        visualizer = self._visualizer(history_reader, history_cache_ttl=300)
+
+        visualizer.generate_charts()
+        visualizer.clear_history_cache()
+        visualizer.generate_charts()
+
+        assert history_reader.load.call_count == 2
+
+    def test_negative_ttl_raises_error(self):
+        """Test that a negative history_cache_ttl raises ValueError."""
+        with pytest.raises(ValueError, match="history_cache_ttl"):
+            self._visualizer(self._history_reader(), history_cache_ttl=-1)
+
+
+class TestDateTicks:
+    """Tests for x-axis date tick spacing."""
+
+    def test_short_history_ticks_every_second_day(self):
+        """Test that short histories keep a tick every second day."""
+        from chronomaly.infrastructure.visualizers.timeseries import (
+            _day_tick_interval,
+        )
+
+        index = pd.date_range("2024-01-01", periods=30)
+
+        assert _day_tick_interval(index) == 2
+
+    def test_long_history_tick_interval_is_widened(self):
+        """Test that long histories get at most 30 ticks."""
+        from chronomaly.infrastructure.visualizers.timeseries import (
+            _MAX_DATE_TICKS,
+            _day_tick_interval,
+        )
+
+        index = pd.date_range("2019-01-01", periods=2000)
+        interval = _day_tick_interval(index)
+
+        assert 1999 / interval <= _MAX_DATE_TICKS
+
+
+class TestQuantizedCharts:
+    """Tests for palette-quantized chart encoding."""
+
+    def test_quantized_chart_is_smaller_palette_png(self):
+        """Test that quantize_charts produces a smaller palette PNG."""
+        import io
+        from PIL import Image
+
+        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
+        history_df = pd.DataFrame(
+            {"metric_a": range(60)},
+            index=pd.date_range("2024-01-01", periods=60),
+        )
+
+        charts = {}
+        for quantize in (False, True):
+            visualizer = TimeSeriesVisualizer(
+                anomaly_data=DataFrameDataReader(anomaly_df),
+                history_data=DataFrameDataReader(history_df),
+                quantize_charts=quantize,
+            )
+            charts[quantize] = base64.b64decode(
+                visualizer.generate_charts()["metric_a"]
+            )
+
+        image = Image.open(io.BytesIO(charts[True]))
+
+        assert image.format == "PNG"
+        assert image.mode == "P"
+        assert len(charts[True]) < len(charts[False])